@@ -0,0 +1,13 @@
+# config/settings.py
+# Environment-derived settings, parsed once at import instead of on every rerun
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_COINS = tuple(os.getenv("DEFAULT_COINS", "BTC,ETH,SOL").split(","))
+AUTO_REFRESH = os.getenv("AUTO_REFRESH_INTERVAL", "60") == "60"
+
+NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+CRYPTOPANIC_API_KEY = os.getenv("CRYPTOPANIC_API_KEY")
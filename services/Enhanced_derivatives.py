@@ -1,15 +1,30 @@
 # services/Enhanced_derivatives.py
-import ccxt
+import ccxt.async_support as ccxt
 import asyncio
 import aiohttp
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 import logging
 import os
 
 class EnhancedDerivativesService:
-    def __init__(self):
+    # Keys returned by get_perpetual_data, in the order they are built
+    PERPETUAL_FIELDS = ('funding_rates', 'open_interest', 'volume_24h', 'mark_prices', 'next_funding_time')
+
+    # Perpetual fields sourced from the ticker: (ticker key, default)
+    TICKER_FIELDS = {
+        'volume_24h': ('volume', 0),
+        'mark_prices': ('mark_price', 0),
+        'next_funding_time': ('funding_time', None)
+    }
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # A shared session lets every exchange draw from one connection pool
+        # instead of ccxt opening a separate one per exchange; ccxt leaves a
+        # session it was handed open on close()
+        shared = {'session': session} if session is not None else {}
+        
         # Initialize multiple exchanges for broader coverage
         self.exchanges = {
             'binance': ccxt.binance({
@@ -18,7 +33,8 @@ class EnhancedDerivativesService:
                 'enableRateLimit': True, 
                 'options': {'defaultType': 'future'},
                 'timeout': 10000,
-                'sandbox': False
+                'sandbox': False,
+                **shared
             }),
             'bybit': ccxt.bybit({
                 'apiKey': os.getenv('BYBIT_API_KEY'),
@@ -26,7 +42,8 @@ class EnhancedDerivativesService:
                 'enableRateLimit': True,
                 'options': {'defaultType': 'linear'},
                 'timeout': 10000,
-                'sandbox': False
+                'sandbox': False,
+                **shared
             }),
             'okx': ccxt.okx({
                 'apiKey': os.getenv('OKX_API_KEY'),
@@ -35,7 +52,8 @@ class EnhancedDerivativesService:
                 'enableRateLimit': True,
                 'options': {'defaultType': 'swap'},
                 'timeout': 10000,
-                'sandbox': False
+                'sandbox': False,
+                **shared
             })
         }
         
@@ -124,7 +142,7 @@ class EnhancedDerivativesService:
                 elif exchange_name == 'bybit' and coin in ['BTC', 'ETH']:
                     symbol = f"{coin}USDT"
                 
-                rate = exchange.fetch_funding_rate(symbol)
+                rate = await exchange.fetch_funding_rate(symbol)
                 if rate and rate.get('fundingRate'):
                     return rate['fundingRate'] * 100
                     
@@ -166,7 +184,7 @@ class EnhancedDerivativesService:
                 elif exchange_name == 'bybit' and coin in ['BTC', 'ETH']:
                     symbol = f"{coin}USDT"
                 
-                oi = exchange.fetch_open_interest(symbol)
+                oi = await exchange.fetch_open_interest(symbol)
                 if oi and oi.get('openInterestValue'):
                     return float(oi['openInterestValue'])
                     
@@ -184,7 +202,7 @@ class EnhancedDerivativesService:
             since = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
             
             # Try Binance first as it has good historical data
-            funding_history = self.exchanges['binance'].fetch_funding_rate_history(
+            funding_history = await self.exchanges['binance'].fetch_funding_rate_history(
                 symbol, since=since, limit=1000
             )
             
@@ -201,37 +219,36 @@ class EnhancedDerivativesService:
             self.logger.error(f"Error fetching funding history for {coin}: {e}")
             return pd.DataFrame()
     
-    async def get_perpetual_data(self, coins: List[str]) -> Dict:
-        """Get comprehensive perpetual futures data with improved error handling"""
-        cache_key = self._get_cache_key('perpetual_data', *sorted(coins))
+    async def get_perpetual_data(self, coins: List[str], fields: Optional[Sequence[str]] = None) -> Dict:
+        """Get comprehensive perpetual futures data with improved error handling
+
+        ``fields`` limits the result to the requested keys so callers only pay
+        for the sub-fetches they render; all fields are returned by default.
+        """
+        fields = tuple(fields) if fields else self.PERPETUAL_FIELDS
+        cache_key = self._get_cache_key('perpetual_data', *sorted(coins), *sorted(fields))
         cached_data = self._get_cached_data(cache_key)
         if cached_data:
             return cached_data
         
-        data = {
-            'funding_rates': {},
-            'open_interest': {},
-            'volume_24h': {},
-            'mark_prices': {},
-            'next_funding_time': {}
-        }
+        data = {field: {} for field in fields}
         
         # Get funding rates and OI using existing methods
-        funding_rates = await self.get_multi_coin_funding_rates(coins)
-        open_interest = await self.get_multi_coin_open_interest(coins)
+        if 'funding_rates' in fields:
+            data['funding_rates'] = await self.get_multi_coin_funding_rates(coins)
+        if 'open_interest' in fields:
+            data['open_interest'] = await self.get_multi_coin_open_interest(coins)
         
-        data['funding_rates'] = funding_rates
-        data['open_interest'] = open_interest
-        
-        # Get additional data
-        for coin in coins:
-            if coin not in self.supported_coins:
-                continue
-                
-            ticker_data = await self._get_ticker_data_for_coin(coin)
-            data['volume_24h'][coin] = ticker_data.get('volume', 0)
-            data['mark_prices'][coin] = ticker_data.get('mark_price', 0)
-            data['next_funding_time'][coin] = ticker_data.get('funding_time')
+        # Ticker data is only needed for volume, mark price and funding time
+        ticker_fields = [field for field in fields if field in self.TICKER_FIELDS]
+        if ticker_fields:
+            for coin in coins:
+                if coin not in self.supported_coins:
+                    continue
+
+                ticker_data = await self._get_ticker_data_for_coin(coin)
+                for field in ticker_fields:
+                    data[field][coin] = ticker_data.get(*self.TICKER_FIELDS[field])
         
         self._set_cache(cache_key, data)
         return data
@@ -247,7 +264,7 @@ class EnhancedDerivativesService:
                 elif exchange_name == 'bybit' and coin in ['BTC', 'ETH']:
                     symbol = f"{coin}USDT"
                 
-                ticker = exchange.fetch_ticker(symbol)
+                ticker = await exchange.fetch_ticker(symbol)
                 if ticker:
                     return {
                         'volume': ticker.get('quoteVolume', 0),
@@ -312,12 +329,12 @@ class EnhancedDerivativesService:
             
             # Get futures price
             futures_symbol = f"{coin}/USDT:USDT"
-            futures_ticker = exchange.fetch_ticker(futures_symbol)
+            futures_ticker = await exchange.fetch_ticker(futures_symbol)
             futures_price = futures_ticker['last']
             
             # Get spot price
             spot_symbol = f"{coin}/USDT"
-            spot_ticker = exchange.fetch_ticker(spot_symbol)
+            spot_ticker = await exchange.fetch_ticker(spot_symbol)
             spot_price = spot_ticker['last']
             
             if futures_price and spot_price and spot_price > 0:
@@ -376,6 +393,13 @@ class EnhancedDerivativesService:
         """Clear the cache manually"""
         self._cache.clear()
         self.logger.info("Cache cleared")
+
+    async def close(self):
+        """Close the exchanges' underlying HTTP sessions"""
+        await asyncio.gather(
+            *(exchange.close() for exchange in self.exchanges.values()),
+            return_exceptions=True
+        )
     
     async def health_check(self) -> Dict[str, bool]:
         """Check health of all exchanges"""
@@ -384,7 +408,7 @@ class EnhancedDerivativesService:
         for name, exchange in self.exchanges.items():
             try:
                 # Try to fetch BTC ticker as health check
-                ticker = exchange.fetch_ticker('BTC/USDT')
+                ticker = await exchange.fetch_ticker('BTC/USDT')
                 health[name] = bool(ticker and ticker.get('last'))
             except:
                 health[name] = False
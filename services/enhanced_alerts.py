@@ -1,5 +1,7 @@
 # services/enhanced_alerts.py
 import os
+import time
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -35,6 +37,11 @@ class EnhancedAlertsService:
         self.alert_history = []
         self.max_alerts_per_hour = 10
         
+        # Last send time per (coin, rounded rate) so a rate that stays past the
+        # threshold doesn't re-alert on every dashboard refresh
+        self.sent_funding_alerts = {}
+        self.funding_alert_ttl = 3600
+        
     def format_funding_alert(self, coin: str, funding_rate: float, threshold: float) -> str:
         """Format funding rate alert message"""
         direction = "HIGH" if funding_rate > 0 else "LOW"
@@ -160,6 +167,14 @@ class EnhancedAlertsService:
             self.logger.error(f"Failed to send email alert: {e}")
             return False
     
+    async def _dispatch(self, subject: str, message: str):
+        """Send an alert via Telegram and email at the same time"""
+        # smtplib is blocking, so the email goes out from a worker thread
+        await asyncio.gather(
+            self.send_telegram_alert(message),
+            asyncio.to_thread(self.send_email_alert, subject, message)
+        )
+    
     def should_send_alert(self, alert_type: str) -> bool:
         """Rate limiting for alerts"""
         now = datetime.now()
@@ -186,18 +201,24 @@ class EnhancedAlertsService:
         
         return True
     
+    def _funding_alert_is_new(self, coin: str, funding_rate: float) -> bool:
+        """Check whether this coin and rate bucket were alerted within the TTL"""
+        now = time.monotonic()
+        key = (coin, round(funding_rate, 1))
+        last_sent = self.sent_funding_alerts.get(key)
+        return last_sent is None or now - last_sent > self.funding_alert_ttl
+    
     async def send_funding_alert(self, coin: str, funding_rate: float, threshold: float):
         """Send funding rate alert"""
+        if not self._funding_alert_is_new(coin, funding_rate):
+            return
         if not self.should_send_alert('funding'):
             return
         
+        self.sent_funding_alerts[(coin, round(funding_rate, 1))] = time.monotonic()
         message = self.format_funding_alert(coin, funding_rate, threshold)
         
-        # Send via Telegram
-        await self.EnhancedAlertsService.send_telegram_alert(message)
-        
-        # Send via email
-        self.send_email_alert(f"Funding Rate Alert - {coin}", message)
+        await self._dispatch(f"Funding Rate Alert - {coin}", message)
         
         # Record alert
         self.alert_history.append({
@@ -214,8 +235,7 @@ class EnhancedAlertsService:
         
         message = self.format_whale_alert(whale_data)
         
-        await self.EnhancedAlertsService.send_telegram_alert(message)
-        self.send_email_alert(f"Whale Alert - {whale_data['symbol']}", message)
+        await self._dispatch(f"Whale Alert - {whale_data['symbol']}", message)
         
         self.alert_history.append({
             'type': 'whale',
@@ -231,8 +251,7 @@ class EnhancedAlertsService:
         
         message = self.format_liquidation_alert(liquidation_data)
         
-        await self.EnhancedAlertsService.send_telegram_alert(message)
-        self.send_email_alert(f"Liquidation Alert - {coin}", message)
+        await self._dispatch(f"Liquidation Alert - {coin}", message)
         
         self.alert_history.append({
             'type': 'liquidation',
@@ -245,8 +264,7 @@ class EnhancedAlertsService:
         """Send periodic market summary"""
         message = self.format_market_summary(market_data)
         
-        await self.EnhancedAlertsService.send_telegram_alert(message)
-        self.send_email_alert("Market Summary Report", message)
+        await self._dispatch("Market Summary Report", message)
     
     def get_alert_stats(self) -> Dict:
         """Get alert statistics"""
@@ -1,73 +1,72 @@
 # services/liquidation_tracker.py
 import asyncio
 import aiohttp
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import random
 import logging
 
+_RNG = np.random.default_rng()
+
 class LiquidationTracker:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://fapi.binance.com"  # Binance Futures API
         
-    async def get_liquidation_data(self, coins: List[str]) -> Dict:
-        """Get liquidation data for specified coins"""
-        liquidation_data = {}
-        
-        for coin in coins:
-            try:
-                # Simulate realistic liquidation data
-                # In production, this would fetch from liquidation APIs
-                long_liquidations = random.uniform(1, 50) * 1000000
-                short_liquidations = random.uniform(1, 30) * 1000000
-                
-                liquidation_data[coin] = {
-                    'total': long_liquidations + short_liquidations,
-                    'long_liquidations': long_liquidations,
-                    'short_liquidations': short_liquidations,
-                    'liquidation_ratio': long_liquidations / (long_liquidations + short_liquidations) if (long_liquidations + short_liquidations) > 0 else 0.5,
-                    'avg_liquidation_size': random.uniform(10000, 500000),
-                    'liquidation_count': random.randint(50, 500)
-                }
-                
-            except Exception as e:
-                self.logger.warning(f"Error fetching liquidation data for {coin}: {e}")
-                liquidation_data[coin] = {
-                    'total': 0,
-                    'long_liquidations': 0,
-                    'short_liquidations': 0,
-                    'liquidation_ratio': 0.5,
-                    'avg_liquidation_size': 0,
-                    'liquidation_count': 0
-                }
-        
-        return liquidation_data
+    LIQUIDATION_COLUMNS = [
+        'total', 'long_liquidations', 'short_liquidations',
+        'liquidation_ratio', 'avg_liquidation_size', 'liquidation_count'
+    ]
+    
+    async def get_liquidation_data(self, coins: List[str]) -> pd.DataFrame:
+        """Get liquidation data for specified coins, one row per coin"""
+        n = len(coins)
+        
+        # Simulate realistic liquidation data for every coin at once
+        # In production, this would fetch from liquidation APIs
+        long_liquidations = _RNG.uniform(1, 50, n) * 1000000
+        short_liquidations = _RNG.uniform(1, 30, n) * 1000000
+        total = long_liquidations + short_liquidations
+        
+        # Column-per-field, aligned to the requested coins, so callers can sum
+        # a whole column instead of looking each coin up
+        return pd.DataFrame({
+            'total': total,
+            'long_liquidations': long_liquidations,
+            'short_liquidations': short_liquidations,
+            'liquidation_ratio': long_liquidations / total,  # Both sides are at least $1M
+            'avg_liquidation_size': _RNG.uniform(10000, 500000, n),
+            'liquidation_count': _RNG.integers(50, 500, n, endpoint=True)
+        }, index=pd.Index(coins, name='coin'), columns=self.LIQUIDATION_COLUMNS)
     
     async def get_liquidation_heatmap_data(self, coins: List[str]) -> Dict:
         """Get liquidation concentration data for heatmap"""
-        heatmap_data = {}
-        
         price_levels = ['Support 1', 'Support 2', 'Current', 'Resistance 1', 'Resistance 2']
-        
-        for coin in coins:
-            coin_data = {}
-            for level in price_levels:
-                # Simulate liquidation concentration at different price levels
-                long_liq = random.uniform(0, 100) * 1000000
-                short_liq = random.uniform(0, 80) * 1000000
-                
-                coin_data[level] = {
-                    'long_liquidations': long_liq,
-                    'short_liquidations': short_liq,
-                    'total_liquidations': long_liq + short_liq,
-                    'price_distance': random.uniform(-10, 10)  # % from current price
+        shape = (len(coins), len(price_levels))
+        
+        # Simulate liquidation concentration at every coin/price level at once
+        long_liq = _RNG.uniform(0, 100, shape) * 1000000
+        short_liq = _RNG.uniform(0, 80, shape) * 1000000
+        total_liq = long_liq + short_liq
+        price_distance = _RNG.uniform(-10, 10, shape)  # % from current price
+        
+        return {
+            coin: {
+                level: {
+                    'long_liquidations': long,
+                    'short_liquidations': short,
+                    'total_liquidations': total,
+                    'price_distance': distance
                 }
-            
-            heatmap_data[coin] = coin_data
-        
-        return heatmap_data
+                for level, long, short, total, distance in zip(price_levels, *row)
+            }
+            for coin, *row in zip(
+                coins, long_liq.tolist(), short_liq.tolist(),
+                total_liq.tolist(), price_distance.tolist()
+            )
+        }
     
     async def get_recent_liquidations(self, coins: List[str], limit: int = 20) -> List[Dict]:
         """Get recent liquidation events"""
@@ -121,21 +120,20 @@ class LiquidationTracker:
             'liquidation_trend': 'NEUTRAL'
         }
         
-        liquidation_data = await self.get_liquidation_data(coins)
+        liquidation_df = await self.get_liquidation_data(coins)
         
-        total_liq = sum([data['total'] for data in liquidation_data.values()])
-        total_long_liq = sum([data['long_liquidations'] for data in liquidation_data.values()])
-        total_short_liq = sum([data['short_liquidations'] for data in liquidation_data.values()])
+        total_liq = liquidation_df['total'].sum()
+        total_long_liq = liquidation_df['long_liquidations'].sum()
+        total_short_liq = liquidation_df['short_liquidations'].sum()
         
         stats['total_liquidations'] = total_liq
         stats['long_percentage'] = (total_long_liq / total_liq * 100) if total_liq > 0 else 0
         stats['short_percentage'] = (total_short_liq / total_liq * 100) if total_liq > 0 else 0
         
         # Find most liquidated coin
-        if liquidation_data:
-            most_liquidated = max(liquidation_data.items(), key=lambda x: x[1]['total'])
-            stats['most_liquidated_coin'] = most_liquidated[0]
-            stats['largest_liquidation'] = max([data['avg_liquidation_size'] for data in liquidation_data.values()])
+        if not liquidation_df.empty:
+            stats['most_liquidated_coin'] = liquidation_df['total'].idxmax()
+            stats['largest_liquidation'] = liquidation_df['avg_liquidation_size'].max()
         
         # Determine trend
         if stats['long_percentage'] > 60:
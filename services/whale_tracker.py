@@ -12,7 +12,29 @@ from enum import Enum
 import logging
 from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import random
+
+# Schema of the whale activity DataFrame, in column order
+WHALE_DTYPES = {
+    'Timestamp': 'datetime64[ns]',
+    'Address': 'string',
+    'Symbol': 'category',
+    'Activity': 'category',
+    'Position_Size': 'float64',
+    'Price': 'float64',
+    'Estimated_Value': 'float64',
+    'Exchange': 'category',
+    'Confidence': 'float64'
+}
+WHALE_COLUMNS = list(WHALE_DTYPES)
+
+# Simulated position size range per coin, in coin units; others use (10000, 500000)
+WHALE_SIZE_RANGES = {
+    'BTC': (10, 500),
+    'ETH': (100, 2000),
+    'SOL': (1000, 50000)
+}
+
+_RNG = np.random.default_rng()
 
 class ActivityType(Enum):
     OPEN_LONG = "Open Long"
@@ -54,10 +76,14 @@ class WhaleProfile:
     last_activity: datetime
 
 class WhaleTrackerService:
-    def __init__(self, api_keys: Optional[Dict[str, str]] = None):
+    def __init__(self, api_keys: Optional[Dict[str, str]] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.logger = logging.getLogger(__name__)
         self.api_keys = api_keys or {}
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A session handed in is shared with other services and stays open;
+        # only one opened by ensure_session is closed on exit
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = False
         self.cache = {}
         self.cache_ttl = 30  # 30 seconds cache
         
@@ -99,18 +125,27 @@ class WhaleTrackerService:
             'bybit': 'https://api.bybit.com/v5',
         }
 
+    async def ensure_session(self) -> aiohttp.ClientSession:
+        """Open the HTTP session if there is none, reusing it across calls"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={'User-Agent': 'WhaleTracker/1.0'}
+            )
+            self._owns_session = True
+        return self.session
+
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'WhaleTracker/1.0'}
-        )
+        await self.ensure_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
 
     def _is_cache_valid(self, key: str) -> bool:
         """Check if cached data is still valid"""
@@ -131,69 +166,79 @@ class WhaleTrackerService:
             'timestamp': time.time()
         }
 
+    async def _fetch_batched(self, fetch, coins: List[str]) -> List:
+        """Run a per-coin fetch for every coin concurrently, in coin order"""
+        results = await asyncio.gather(*(fetch(coin) for coin in coins), return_exceptions=True)
+
+        batched = []
+        for coin, result in zip(coins, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing {coin}: {result}")
+                result = None
+            batched.append(result)
+        return batched
+
     def generate_realistic_whale_data(self, coins: List[str], count: int = 15) -> List[WhaleActivity]:
         """Generate realistic whale transaction data"""
-        activities = []
         exchanges = ['Binance', 'Coinbase Pro', 'Kraken', 'Bybit', 'OKX', 'Uniswap V3', 'PancakeSwap', 'On-Chain']
+        addresses = list(self.known_whale_addresses.keys())
         
-        # Generate activities for the last 24 hours
+        # Position activities with realistic probabilities (the weights cover
+        # these eight; liquidations and large trades are not simulated)
+        activity_types = [
+            ActivityType.OPEN_LONG, ActivityType.OPEN_SHORT,
+            ActivityType.CLOSE_LONG, ActivityType.CLOSE_SHORT,
+            ActivityType.ADD_TO_LONG, ActivityType.ADD_TO_SHORT,
+            ActivityType.REDUCE_LONG, ActivityType.REDUCE_SHORT
+        ]
+        activity_weights = [0.25, 0.15, 0.25, 0.15, 0.1, 0.05, 0.03, 0.02]
+        
+        # Every random field is drawn for all activities at once
+        symbols = _RNG.choice(coins, count).tolist()
+        prices = np.array([self.current_prices.get(symbol, 100) for symbol in symbols], dtype=np.float64)
+        
+        # Realistic position sizes based on coin
+        low, high = np.array([WHALE_SIZE_RANGES.get(symbol, (10000, 500000)) for symbol in symbols],
+                             dtype=np.float64).reshape(count, 2).T
+        position_sizes = _RNG.uniform(low, high)
+        estimated_values = position_sizes * prices
+        
+        # Only include significant transactions (>$100k)
+        small = estimated_values < 100000
+        estimated_values[small] = _RNG.uniform(100000, 5000000, int(small.sum()))
+        position_sizes[small] = estimated_values[small] / prices[small]
+        
+        # Random times in the last 24 hours
         base_time = datetime.now()
+        ages = _RNG.uniform(0, 24, count) * 3600 + _RNG.integers(0, 59, count, endpoint=True) * 60
         
-        for i in range(count):
-            # Random time in last 24 hours
-            timestamp = base_time - timedelta(
-                hours=random.uniform(0, 24),
-                minutes=random.randint(0, 59)
-            )
-            
-            # Random coin
-            symbol = random.choice(coins)
-            price = self.current_prices.get(symbol, 100)
-            
-            # Random whale address
-            address = random.choice(list(self.known_whale_addresses.keys()))
-            address_name = self.known_whale_addresses[address]
-            
-            # Generate realistic position sizes based on coin
-            if symbol == 'BTC':
-                position_size = random.uniform(10, 500)  # 10-500 BTC
-            elif symbol == 'ETH':
-                position_size = random.uniform(100, 2000)  # 100-2000 ETH
-            elif symbol == 'SOL':
-                position_size = random.uniform(1000, 50000)  # 1k-50k SOL
-            else:
-                position_size = random.uniform(10000, 500000)  # Various amounts
-            
-            estimated_value = position_size * price
-            
-            # Only include significant transactions (>$100k)
-            if estimated_value < 100000:
-                estimated_value = random.uniform(100000, 5000000)
-                position_size = estimated_value / price
-            
-            # Random activity type with realistic probabilities
-            activity_weights = [0.25, 0.15, 0.25, 0.15, 0.1, 0.05, 0.03, 0.02]
-            activity = np.random.choice(list(ActivityType), p=activity_weights)
-            
-            # Random exchange
-            exchange = random.choice(exchanges)
-            
-            # Format address for display
-            display_address = f"{address[:6]}...{address[-4:]} ({address_name})"
-            
-            whale_activity = WhaleActivity(
-                timestamp=timestamp,
-                address=display_address,
+        picks = zip(
+            ages.tolist(),
+            symbols,
+            _RNG.choice(addresses, count).tolist(),
+            _RNG.choice(len(activity_types), count, p=activity_weights).tolist(),
+            position_sizes.tolist(),
+            prices.tolist(),
+            estimated_values.tolist(),
+            _RNG.choice(exchanges, count).tolist(),
+            _RNG.uniform(0.7, 0.95, count).tolist()
+        )
+        
+        activities = [
+            WhaleActivity(
+                timestamp=base_time - timedelta(seconds=age),
+                # Format address for display
+                address=f"{address[:6]}...{address[-4:]} ({self.known_whale_addresses[address]})",
                 symbol=symbol,
-                activity=activity,
+                activity=activity_types[activity],
                 position_size=position_size,
                 price=price,
                 estimated_value=estimated_value,
                 exchange=exchange,
-                confidence=random.uniform(0.7, 0.95)
+                confidence=confidence
             )
-            
-            activities.append(whale_activity)
+            for age, symbol, address, activity, position_size, price, estimated_value, exchange, confidence in picks
+        ]
         
         # Sort by timestamp (newest first)
         activities.sort(key=lambda x: x.timestamp, reverse=True)
@@ -203,51 +248,42 @@ class WhaleTrackerService:
         """Get current token price"""
         return self.current_prices.get(symbol.upper(), 0.0)
 
+    def _activities_to_frame(self, activities: List[WhaleActivity]) -> pd.DataFrame:
+        """Build the whale activity DataFrame with a fixed schema"""
+        records = [
+            (a.timestamp, a.address, a.symbol, a.activity.value, a.position_size,
+             a.price, a.estimated_value, a.exchange, a.confidence)
+            for a in activities
+        ]
+        return pd.DataFrame.from_records(records, columns=WHALE_COLUMNS).astype(WHALE_DTYPES)
+
+    @staticmethod
+    def _filter_min_value(df: pd.DataFrame, min_value: float, floor: float) -> pd.DataFrame:
+        """Keep rows worth at least min_value, relaxing to floor if nothing qualifies"""
+        values = df['Estimated_Value'].to_numpy(dtype=np.float64)
+        mask = values >= min_value
+        if not mask.any():
+            mask = values >= floor
+        return df[mask]
+
     async def get_comprehensive_whale_data(self, coins: List[str], min_position_size: float = 1.0) -> pd.DataFrame:
         """Get comprehensive whale data - enhanced with guaranteed data"""
         try:
             # Generate realistic whale data
             whale_activities = self.generate_realistic_whale_data(coins, count=20)
             
-            # Filter by minimum position size (in millions)
-            min_value = min_position_size * 1000000
-            filtered_activities = [
-                activity for activity in whale_activities
-                if activity.estimated_value >= min_value
-            ]
-            
-            # If no activities meet criteria, lower the threshold
-            if not filtered_activities:
-                filtered_activities = [
-                    activity for activity in whale_activities
-                    if activity.estimated_value >= 100000  # $100k minimum
-                ]
-            
-            # Convert to DataFrame
-            df_data = []
-            for activity in filtered_activities[:12]:  # Limit to 12 most recent
-                df_data.append({
-                    'Timestamp': activity.timestamp,
-                    'Address': activity.address,
-                    'Symbol': activity.symbol,
-                    'Activity': activity.activity.value,
-                    'Position_Size': activity.position_size,
-                    'Price': activity.price,
-                    'Estimated_Value': activity.estimated_value,
-                    'Exchange': activity.exchange,
-                    'Confidence': activity.confidence
-                })
-            
-            df = pd.DataFrame(df_data)
+            # Filter by minimum position size (in millions), falling back to $100k
+            df = self._activities_to_frame(whale_activities)
+            df = self._filter_min_value(df, min_position_size * 1000000, 100000)
+            df = df.head(12)  # Limit to 12 most recent
+            # Flag the frame so callers don't present it as live exchange data
+            df.attrs['simulated'] = True
             return df
-            
+
         except Exception as e:
             self.logger.error(f"Error in get_comprehensive_whale_data: {str(e)}")
             # Return empty DataFrame with proper columns
-            return pd.DataFrame(columns=[
-                'Timestamp', 'Address', 'Symbol', 'Activity', 
-                'Position_Size', 'Price', 'Estimated_Value', 'Exchange', 'Confidence'
-            ])
+            return pd.DataFrame(columns=WHALE_COLUMNS).astype(WHALE_DTYPES)
 
     async def get_recent_whale_activity(self, coins: List[str], min_position_size: float = 1.0) -> pd.DataFrame:
         """Get recent whale activity from real APIs"""
@@ -256,47 +292,29 @@ class WhaleTrackerService:
 
             self.logger.info(f"Attempting to fetch real whale data for coins: {coins}")
 
-            # Get real whale data from multiple sources
-            for coin in coins:
-                try:
-                    # Try to get real exchange data
-                    self.logger.info(f"Fetching exchange data for {coin}")
-                    exchange_data = await self._get_exchange_whale_data(coin)
-                    if exchange_data:
-                        self.logger.info(f"Found {len(exchange_data)} exchange activities for {coin}")
-                        real_activities.extend(exchange_data)
-
-                    # Try to get on-chain data for ETH-based tokens
-                    if coin in ['ETH', 'USDT', 'USDC', 'LINK', 'UNI']:
-                        self.logger.info(f"Fetching on-chain data for {coin}")
-                        onchain_data = await self._get_onchain_whale_data(coin)
-                        if onchain_data:
-                            self.logger.info(f"Found {len(onchain_data)} on-chain activities for {coin}")
-                            real_activities.extend(onchain_data)
-
-                except Exception as coin_error:
-                    self.logger.error(f"Error processing {coin}: {coin_error}")
-                    continue
+            # The on-chain feed is chain-wide rather than per token, so it is fetched
+            # once alongside the per-coin exchange requests instead of once per coin
+            onchain_coins = [coin for coin in coins if coin in ['ETH', 'USDT', 'USDC', 'LINK', 'UNI']]
+            exchange_results, onchain_data = await asyncio.gather(
+                self._fetch_batched(self._get_exchange_whale_data, coins),
+                self._get_onchain_whale_data(onchain_coins[0]) if onchain_coins else asyncio.sleep(0, result=[])
+            )
+
+            for coin, exchange_data in zip(coins, exchange_results):
+                if exchange_data:
+                    self.logger.info(f"Found {len(exchange_data)} exchange activities for {coin}")
+                    real_activities.extend(exchange_data)
+
+            if onchain_data:
+                self.logger.info(f"Found {len(onchain_data)} on-chain activities for {onchain_coins}")
+                real_activities.extend(onchain_data)
 
             # If we have real data, use it
             if real_activities:
                 self.logger.info(f"Using {len(real_activities)} real whale activities")
-                df_data = []
-                for activity in real_activities[:20]:  # Limit to 20 most recent
-                    df_data.append({
-                        'Timestamp': activity.timestamp,
-                        'Address': activity.address,
-                        'Symbol': activity.symbol,
-                        'Activity': activity.activity.value,
-                        'Position_Size': activity.position_size,
-                        'Price': activity.price,
-                        'Estimated_Value': activity.estimated_value,
-                        'Exchange': activity.exchange,
-                        'Confidence': activity.confidence
-                    })
-
-                df = pd.DataFrame(df_data)
-                return df
+                df = self._activities_to_frame(real_activities)
+                df = self._filter_min_value(df, min_position_size * 1000000, 0)
+                return df.head(20)  # Limit to 20 most recent
             else:
                 # Fallback to enhanced realistic data
                 self.logger.info("No real data found, using enhanced realistic data")
@@ -320,21 +338,30 @@ class WhaleTrackerService:
             if df.empty:
                 return {}
 
+            # Build the masks once over the whole frame
+            # Long positions (Open Long, Add to Long, Large Buy)
+            long_mask = df['Activity'].str.contains('Long|Add to Long|Large Buy', na=False).to_numpy()
+            # Short positions (Open Short, Add to Short, Close Long, Reduce Long, Large Sell)
+            short_mask = df['Activity'].str.contains('Short|Close Long|Reduce|Large Sell', na=False).to_numpy()
+
+            # One hash pass groups every coin, instead of a full-frame mask per coin
+            sides = pd.DataFrame({
+                'long': df['Estimated_Value'].where(long_mask, 0.0),
+                'short': df['Estimated_Value'].where(short_mask, 0.0),
+                'address': df['Address']
+            })
+            grouped = sides.groupby(df['Symbol'], observed=True, sort=False)
+            totals = grouped[['long', 'short']].sum()
+            whale_counts = grouped['address'].nunique()
+
             summary = {}
             for coin in coins:
-                coin_df = df[df['Symbol'] == coin]
-                if coin_df.empty:
+                if coin not in totals.index:
                     continue
 
-                # Calculate long positions (Open Long, Add to Long, Large Buy)
-                long_activities = coin_df[coin_df['Activity'].str.contains('Long|Add to Long|Large Buy', na=False)]
-                long_positions = long_activities['Estimated_Value'].sum()
-
-                # Calculate short positions (Open Short, Add to Short, Close Long, Reduce Long, Large Sell)
-                short_activities = coin_df[coin_df['Activity'].str.contains('Short|Close Long|Reduce|Large Sell', na=False)]
-                short_positions = short_activities['Estimated_Value'].sum()
-
-                whale_count = coin_df['Address'].nunique()
+                long_positions = totals.at[coin, 'long']
+                short_positions = totals.at[coin, 'short']
+                whale_count = int(whale_counts[coin])
 
                 summary[coin] = {
                     'total_long_positions': long_positions,
@@ -342,7 +369,9 @@ class WhaleTrackerService:
                     'net_position': long_positions - short_positions,
                     'long_short_ratio': (long_positions / short_positions) if short_positions > 0 else float('inf'),
                     'whale_count': whale_count,
-                    'total_volume': long_positions + short_positions
+                    'total_volume': long_positions + short_positions,
+                    # Built from the simulated feed, not exchange data
+                    'simulated': True
                 }
 
             return summary
@@ -358,45 +387,11 @@ class WhaleTrackerService:
         try:
             self.logger.info(f"Attempting to fetch real accumulation data for: {coins}")
 
-            for coin in coins:
-                try:
-                    # Try to get real data from multiple sources
-                    long_positions = 0
-                    short_positions = 0
-                    whale_count = 0
-
-                    # Get data from Binance futures
-                    self.logger.info(f"Fetching Binance accumulation for {coin}")
-                    binance_data = await self._get_binance_accumulation(coin)
-                    if binance_data:
-                        self.logger.info(f"Found Binance data for {coin}: {binance_data}")
-                        long_positions += binance_data.get('long_positions', 0)
-                        short_positions += binance_data.get('short_positions', 0)
-                        whale_count += binance_data.get('whale_count', 0)
-
-                    # Get on-chain accumulation for supported tokens
-                    if coin in ['ETH', 'BTC']:
-                        self.logger.info(f"Fetching on-chain accumulation for {coin}")
-                        onchain_data = await self._get_onchain_accumulation(coin)
-                        if onchain_data:
-                            self.logger.info(f"Found on-chain data for {coin}: {onchain_data}")
-                            long_positions += onchain_data.get('accumulation', 0)
-                            whale_count += onchain_data.get('whale_count', 0)
-
-                    if long_positions > 0 or short_positions > 0:
-                        summary[coin] = {
-                            'total_long_positions': long_positions,
-                            'total_short_positions': short_positions,
-                            'net_position': long_positions - short_positions,
-                            'long_short_ratio': (long_positions / short_positions) if short_positions > 0 else float('inf'),
-                            'whale_count': whale_count,
-                            'total_volume': long_positions + short_positions
-                        }
-                        self.logger.info(f"Added accumulation data for {coin}")
-
-                except Exception as coin_error:
-                    self.logger.error(f"Error processing accumulation for {coin}: {coin_error}")
-                    continue
+            results = await self._fetch_batched(self._get_coin_accumulation, coins)
+            for coin, coin_summary in zip(coins, results):
+                if coin_summary:
+                    summary[coin] = coin_summary
+                    self.logger.info(f"Added accumulation data for {coin}")
 
         except Exception as e:
             self.logger.error(f"Error getting real accumulation data: {e}")
@@ -404,6 +399,42 @@ class WhaleTrackerService:
         self.logger.info(f"Real accumulation summary: {len(summary)} coins with data")
         return summary
 
+    async def _get_coin_accumulation(self, coin: str) -> Optional[Dict]:
+        """Combine exchange and on-chain accumulation data for a single coin"""
+        long_positions = 0
+        short_positions = 0
+        whale_count = 0
+
+        # Binance futures and on-chain sources are independent, fetch them together
+        self.logger.info(f"Fetching accumulation for {coin}")
+        binance_data, onchain_data = await asyncio.gather(
+            self._get_binance_accumulation(coin),
+            self._get_onchain_accumulation(coin) if coin in ['ETH', 'BTC'] else asyncio.sleep(0, result=None)
+        )
+
+        if binance_data:
+            self.logger.info(f"Found Binance data for {coin}: {binance_data}")
+            long_positions += binance_data.get('long_positions', 0)
+            short_positions += binance_data.get('short_positions', 0)
+            whale_count += binance_data.get('whale_count', 0)
+
+        if onchain_data:
+            self.logger.info(f"Found on-chain data for {coin}: {onchain_data}")
+            long_positions += onchain_data.get('accumulation', 0)
+            whale_count += onchain_data.get('whale_count', 0)
+
+        if long_positions > 0 or short_positions > 0:
+            return {
+                'total_long_positions': long_positions,
+                'total_short_positions': short_positions,
+                'net_position': long_positions - short_positions,
+                'long_short_ratio': (long_positions / short_positions) if short_positions > 0 else float('inf'),
+                'whale_count': whale_count,
+                'total_volume': long_positions + short_positions
+            }
+
+        return None
+
     async def _get_binance_accumulation(self, coin: str) -> Optional[Dict]:
         """Get accumulation data from Binance futures"""
         try:
@@ -479,22 +510,31 @@ class WhaleTrackerService:
         try:
             df = await self.get_comprehensive_whale_data(coins, threshold / 1000000)
             
+            if df.empty:
+                return alerts
+            
             # Recent large movements (last 30 minutes)
             recent_time = datetime.now() - timedelta(minutes=30)
-            recent_activities = df[df['Timestamp'] > recent_time] if not df.empty else pd.DataFrame()
+            recent = df[(df['Timestamp'] > recent_time) & (df['Estimated_Value'] > threshold)]
             
-            for _, row in recent_activities.iterrows():
-                if row['Estimated_Value'] > threshold:
-                    alerts.append({
-                        'timestamp': row['Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                        'symbol': row['Symbol'],
-                        'type': 'LARGE_MOVEMENT',
-                        'amount': row['Estimated_Value'],
-                        'activity': row['Activity'],
-                        'address': row['Address'],
-                        'exchange': row['Exchange'],
-                        'severity': 'HIGH' if row['Estimated_Value'] > 5000000 else 'MEDIUM'
-                    })
+            # Timestamps are rendered as one column, without boxing a row per alert
+            stamps = recent['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+            alerts = [
+                {
+                    'timestamp': stamp,
+                    'symbol': symbol,
+                    'type': 'LARGE_MOVEMENT',
+                    'amount': amount,
+                    'activity': activity,
+                    'address': address,
+                    'exchange': exchange,
+                    'severity': 'HIGH' if amount > 5000000 else 'MEDIUM'
+                }
+                for stamp, symbol, amount, activity, address, exchange in zip(
+                    stamps, recent['Symbol'], recent['Estimated_Value'].tolist(),
+                    recent['Activity'], recent['Address'], recent['Exchange']
+                )
+            ]
                     
         except Exception as e:
             self.logger.error(f"Error getting real-time alerts: {str(e)}")
@@ -628,12 +668,14 @@ class WhaleTrackerService:
             
             # Convert DataFrame to list of dictionaries
             records = df.to_dict('records')
+            # Timestamps are rendered as one column; missing ones become ''
+            stamps = df['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('').tolist()
             
             # Format the data for frontend consumption
             formatted_records = []
-            for record in records:
+            for stamp, record in zip(stamps, records):
                 formatted_record = {
-                    'timestamp': record['Timestamp'].strftime('%Y-%m-%d %H:%M:%S') if pd.notna(record['Timestamp']) else '',
+                    'timestamp': stamp,
                     'address': record['Address'],
                     'symbol': record['Symbol'],
                     'activity': record['Activity'],
@@ -658,8 +700,9 @@ class WhaleTrackerService:
 
     async def _get_whale_data_async(self, coins: List[str], min_position_size: float) -> pd.DataFrame:
         """Async helper method"""
-        async with self:
-            return await self.get_comprehensive_whale_data(coins, min_position_size)
+        # Runs under asyncio.run on a private loop, where a session bound to
+        # the caller's loop must not be used; the simulated feed needs none
+        return await self.get_comprehensive_whale_data(coins, min_position_size)
 
     def _get_sample_whale_data(self) -> List[Dict]:
         """Fallback sample data"""
@@ -2,26 +2,74 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import asyncio
-from datetime import datetime
+import aiohttp
+import orjson
+import plotly.io as pio
+from datetime import datetime, timedelta
+from config.settings import DEFAULT_COINS, AUTO_REFRESH, NEWS_API_KEY, CRYPTOPANIC_API_KEY
 from services.Enhanced_derivatives import EnhancedDerivativesService
 from services.whale_tracker import WhaleTrackerService
 from services.liquidation_tracker import LiquidationTracker
 from services.enhanced_alerts import EnhancedAlertsService
-from utils.enhanced_plots import *
-import requests
-import os
-from dotenv import load_dotenv
-import traceback
+from utils.enhanced_plots import create_funding_chart, create_open_interest_chart, create_whale_activity_chart
+from utils.formatting import format_money_compact, downcast_for_display
+from utils.styles import DISCORD_CSS
+import logging
+import threading
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# st.plotly_chart serializes through plotly.io; pin its engine to orjson (a
+# requirement) instead of 'auto', which would quietly fall back to stdlib json
+pio.json.config.default_engine = 'orjson'
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """One event loop on a background thread, shared by every session and rerun"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-event-loop", daemon=True).start()
+    return loop
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+async def open_http_session():
+    """Pooled HTTP session; keep-alive sockets are reused across reruns and users"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=30),
+        headers={'User-Agent': 'WhaleTracker/1.0'}
+    )
 
-# Load environment variables
-load_dotenv()
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """One HTTP session per process, opened on the shared event loop"""
+    return run_async(open_http_session())
+
+class Services(NamedTuple):
+    alerts: EnhancedAlertsService
+    deriv: EnhancedDerivativesService
+    whale: WhaleTrackerService
+    liq: LiquidationTracker
+
+@st.cache_resource(show_spinner=False)
+def get_services():
+    """Service singletons, so exchange clients and HTTP pools outlive each rerun"""
+    # One pooled HTTP session for the exchanges, whale tracker and news feeds
+    session = get_http_session()
+    return Services(
+        alerts=EnhancedAlertsService(),
+        deriv=EnhancedDerivativesService(session=session),
+        whale=WhaleTrackerService(session=session),
+        liq=LiquidationTracker()
+    )
 
 # Init services
-alerts_service = EnhancedAlertsService()
-deriv_service = EnhancedDerivativesService()
-whale_tracker = WhaleTrackerService()
-liquidation_tracker = LiquidationTracker()
+svc = get_services()
 
 st.set_page_config(
     page_title="Crypto Market Dashboard",
@@ -30,443 +78,219 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Discord-inspired styling
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Whitney:wght@400;500;600;700&display=swap');
-    
-    /* Main app styling */
-    .stApp {
-        background: linear-gradient(135deg, #36393f 0%, #2f3136 25%, #36393f 50%, #202225 75%, #2f3136 100%);
-        font-family: 'Whitney', 'Helvetica Neue', Helvetica, Arial, sans-serif;
-    }
-    
-    /* Hide default streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Custom header */
-    .discord-header {
-        background: linear-gradient(135deg, #5865f2 0%, #7289da 35%, #5865f2 100%);
-        padding: 1.5rem 2rem;
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(88, 101, 242, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .discord-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="discord-pattern" x="0" y="0" width="20" height="20" patternUnits="userSpaceOnUse"><circle cx="10" cy="10" r="1" fill="rgba(255,255,255,0.1)"/></pattern></defs><rect width="100" height="100" fill="url(%23discord-pattern)"/></svg>');
-        opacity: 0.3;
-    }
-    
-    .discord-header h1 {
-        color: white;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        position: relative;
-        z-index: 1;
-    }
-    
-    .discord-header p {
-        color: rgba(255,255,255,0.9);
-        font-size: 1.1rem;
-        margin: 0.5rem 0 0 0;
-        position: relative;
-        z-index: 1;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: #2f3136;
-        border-right: 1px solid #40444b;
-    }
-    
-    .css-1d391kg .css-1y4p8pa {
-        background: #36393f;
-        border-radius: 8px;
-        border: 1px solid #40444b;
-        color: #dcddde;
-    }
-    
-    /* Card styling */
-    .discord-card {
-        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
-        border: 1px solid #40444b;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 4px 16px rgba(0,0,0,0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .discord-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(180deg, #5865f2, #7289da);
-        border-radius: 0 0 0 4px;
-    }
-    
-    .discord-card h3 {
-        color: #ffffff;
-        font-weight: 600;
-        margin-bottom: 1rem;
-        font-size: 1.3rem;
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        background: #2f3136;
-        border-radius: 8px;
-        padding: 4px;
-        border: 1px solid #40444b;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        color: #b9bbbe;
-        border-radius: 6px;
-        font-weight: 500;
-        padding: 12px 20px;
-        transition: all 0.2s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: #40444b;
-        color: #dcddde;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #5865f2, #7289da) !important;
-        color: white !important;
-        box-shadow: 0 2px 8px rgba(88, 101, 242, 0.4);
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(145deg, #40444b 0%, #36393f 100%);
-        border: 1px solid #4f545c;
-        border-radius: 10px;
-        padding: 1.2rem;
-        text-align: center;
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 24px rgba(88, 101, 242, 0.2);
-    }
-    
-    .metric-value {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: #00d4aa;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-label {
-        color: #b9bbbe;
-        font-size: 0.9rem;
-        font-weight: 500;
-    }
-    
-    /* News card styling */
-    .news-card {
-        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
-        border: 1px solid #40444b;
-        border-radius: 10px;
-        padding: 1.2rem;
-        margin-bottom: 1rem;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .news-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 3px;
-        height: 100%;
-        background: linear-gradient(180deg, #faa61a, #f04747);
-    }
-    
-    .news-card:hover {
-        transform: translateX(4px);
-        box-shadow: 0 6px 20px rgba(250, 166, 26, 0.2);
-        border-color: #faa61a;
-    }
-    
-    .news-title {
-        color: #ffffff;
-        font-weight: 600;
-        font-size: 1.1rem;
-        margin-bottom: 0.5rem;
-        line-height: 1.4;
-    }
-    
-    .news-meta {
-        color: #72767d;
-        font-size: 0.85rem;
-    }
-    
-    .news-link {
-        color: #00d4aa;
-        text-decoration: none;
-        font-weight: 500;
-    }
-    
-    .news-link:hover {
-        color: #1abc9c;
-        text-decoration: underline;
-    }
-    
-    /* Whale activity styling */
-    .whale-activity {
-        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
-        border: 1px solid #40444b;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 0.8rem;
-        border-left: 4px solid #f04747;
-    }
-    
-    .whale-activity.buy {
-        border-left-color: #43b581;
-    }
-    
-    .whale-activity.sell {
-        border-left-color: #f04747;
-    }
-    
-    /* Error/Warning styling */
-    .whale-error {
-        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
-        border: 1px solid #f04747;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 0.8rem;
-        color: #f04747;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #5865f2, #7289da);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.6rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.2s ease;
-        box-shadow: 0 2px 8px rgba(88, 101, 242, 0.3);
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #4752c4, #5865f2);
-        transform: translateY(-1px);
-        box-shadow: 0 4px 12px rgba(88, 101, 242, 0.4);
-    }
-    
-    /* DataFrame styling */
-    .dataframe {
-        background: #2f3136;
-        border: 1px solid #40444b;
-        border-radius: 8px;
-    }
-    
-    /* Text colors */
-    .stMarkdown, .stText {
-        color: #dcddde;
-    }
-    
-    h1, h2, h3, h4, h5, h6 {
-        color: #ffffff !important;
-    }
-    
-    /* Success/Error indicators */
-    .positive {
-        color: #43b581 !important;
-    }
-    
-    .negative {
-        color: #f04747 !important;
-    }
-    
-    .neutral {
-        color: #faa61a !important;
-    }
-    
-    /* Loading spinner */
-    .stSpinner {
-        color: #5865f2;
-    }
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #2f3136;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: #5865f2;
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: #4752c4;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Header
-st.markdown("""
-<div class="discord-header">
-    <h1>🚀 Crypto Market Hub</h1>
-    <p>Real-time tracking • Whale monitoring • Market intelligence</p>
-</div>
-""", unsafe_allow_html=True)
-
-# Sidebar configuration
-with st.sidebar:
-    st.markdown("### 🎛️ **Dashboard Controls**")
-    
-    selected_coins = st.multiselect(
-        "📊 Select Cryptocurrencies", 
-        deriv_service.get_supported_coins(), 
-        default=os.getenv("DEFAULT_COINS", "BTC,ETH,SOL").split(","),
-        help="Choose which coins to monitor"
-    )
-    
-    auto_refresh = st.checkbox(
-        "🔄 Auto Refresh (60s)", 
-        value=os.getenv("AUTO_REFRESH_INTERVAL", "60") == "60"
-    )
-    
-    st.markdown("---")
-    st.markdown("### 📈 **Quick Stats**")
-    
-    # Quick metrics in sidebar
-    if selected_coins:
-        st.markdown(f"**Monitoring:** {len(selected_coins)} coins")
-        st.markdown(f"**Last Update:** {datetime.now().strftime('%H:%M:%S')}")
+@st.cache_data(ttl=3600, show_spinner=False)
+def supported_coins():
+    """Coin universe for the selector, which changes far less often than the page reruns"""
+    return svc.deriv.get_supported_coins()
+
+def render_chrome():
+    """Static page chrome and sidebar controls; returns (selected_coins, auto_refresh)"""
+    # Discord-inspired styling. Streamlit drops elements a rerun does not
+    # re-emit, so this cannot be skipped after the first run
+    st.markdown(DISCORD_CSS, unsafe_allow_html=True)
+
+    # Header
+    st.markdown("""
+    <div class="discord-header">
+        <h1>🚀 Crypto Market Hub</h1>
+        <p>Real-time tracking • Whale monitoring • Market intelligence</p>
+    </div>
+    """, unsafe_allow_html=True)
 
-async def fetch_news():
-    """Fetch crypto news from multiple sources"""
-    all_news = []
+    # Sidebar configuration
+    with st.sidebar:
+        st.markdown("### 🎛️ **Dashboard Controls**")
+        
+        selected_coins = st.multiselect(
+            "📊 Select Cryptocurrencies", 
+            supported_coins(), 
+            default=list(DEFAULT_COINS),
+            help="Choose which coins to monitor"
+        )
+        
+        auto_refresh = st.checkbox(
+            "🔄 Auto Refresh (60s)", 
+            value=AUTO_REFRESH
+        )
+        
+        st.markdown("---")
+        st.markdown("### 📈 **Quick Stats**")
+        
+        # Quick metrics in sidebar
+        if selected_coins:
+            st.markdown(f"**Monitoring:** {len(selected_coins)} coins")
+            st.markdown(f"**Last Update:** {datetime.now().strftime('%H:%M:%S')}")
 
-    # Try NewsAPI first
-    news_api_key = os.getenv("NEWS_API_KEY")
-    if news_api_key:
-        try:
-            url = f"https://newsapi.org/v2/everything?q=cryptocurrency OR bitcoin OR ethereum&sortBy=publishedAt&apiKey={news_api_key}&pageSize=10"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                articles = response.json().get("articles", [])
-                for article in articles:
-                    all_news.append({
-                        'title': article.get('title', ''),
-                        'url': article.get('url', ''),
-                        'published_at': article.get('publishedAt', ''),
-                        'source': 'NewsAPI'
-                    })
-        except Exception as e:
-            print(f"NewsAPI error: {e}")
+    return selected_coins, auto_refresh
 
-    # Try CryptoPanic as backup
-    cryptopanic_key = os.getenv("CRYPTOPANIC_API_KEY")
-    if cryptopanic_key and len(all_news) < 5:
-        try:
-            url = f"https://cryptopanic.com/api/v1/posts/?auth_token={cryptopanic_key}&public=true&kind=news"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                posts = response.json().get("results", [])
-                for post in posts[:10]:
-                    all_news.append({
-                        'title': post.get('title', ''),
-                        'url': post.get('url', ''),
-                        'published_at': post.get('published_at', ''),
-                        'source': 'CryptoPanic'
-                    })
-        except Exception as e:
-            print(f"CryptoPanic error: {e}")
+NEWS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+NEWS_CONCURRENCY = 4
+
+async def fetch_newsapi(session, semaphore):
+    """Latest crypto headlines from NewsAPI"""
+    if not NEWS_API_KEY:
+        return []
+    url = f"https://newsapi.org/v2/everything?q=cryptocurrency OR bitcoin OR ethereum&sortBy=publishedAt&apiKey={NEWS_API_KEY}&pageSize=10"
+    async with semaphore, session.get(url, timeout=NEWS_TIMEOUT) as response:
+        if response.status != 200:
+            return []
+        articles = orjson.loads(await response.read()).get("articles", [])
+    return [{
+        'title': article.get('title', ''),
+        'url': article.get('url', ''),
+        'published_at': article.get('publishedAt', ''),
+        'source': 'NewsAPI'
+    } for article in articles]
+
+async def fetch_cryptopanic(session, semaphore):
+    """Latest news posts from CryptoPanic"""
+    if not CRYPTOPANIC_API_KEY:
+        return []
+    url = f"https://cryptopanic.com/api/v1/posts/?auth_token={CRYPTOPANIC_API_KEY}&public=true&kind=news"
+    async with semaphore, session.get(url, timeout=NEWS_TIMEOUT) as response:
+        if response.status != 200:
+            return []
+        posts = orjson.loads(await response.read()).get("results", [])
+    return [{
+        'title': post.get('title', ''),
+        'url': post.get('url', ''),
+        'published_at': post.get('published_at', ''),
+        'source': 'CryptoPanic'
+    } for post in posts[:10]]
+
+async def fetch_coingecko_trending(session, semaphore):
+    """Trending coins from CoinGecko (free, no API key)"""
+    url = "https://api.coingecko.com/api/v3/search/trending"
+    async with semaphore, session.get(url, timeout=NEWS_TIMEOUT) as response:
+        if response.status != 200:
+            return []
+        coins = orjson.loads(await response.read()).get("coins", [])
+    news = []
+    for coin_info in coins[:5]:
+        coin = coin_info.get("item", {})
+        news.append({
+            'title': f"Trending: {coin.get('name', 'Unknown')} ({coin.get('symbol', 'N/A')}) - Rank #{coin.get('market_cap_rank', 'N/A')}",
+            'url': f"https://www.coingecko.com/en/coins/{coin.get('id', '')}",
+            'published_at': datetime.now().isoformat(),
+            'source': 'CoinGecko Trending'
+        })
+    return news
+
+# Providers in priority order, each only consulted while fewer than
+# `needed_below` articles have been collected
+NEWS_SOURCES = (
+    ('NewsAPI', fetch_newsapi, float('inf')),
+    ('CryptoPanic', fetch_cryptopanic, 5),
+    ('CoinGecko trending', fetch_coingecko_trending, 3),
+)
 
-    # Try CoinGecko news as final backup (free)
-    if len(all_news) < 3:
+async def fetch_news(session):
+    """Fetch crypto news from multiple sources"""
+    all_news = []
+
+    # Providers start together, but are consumed in priority order and any
+    # fallback that is no longer needed is cancelled before it completes
+    semaphore = asyncio.Semaphore(NEWS_CONCURRENCY)
+    tasks = [
+        asyncio.ensure_future(fetcher(session, semaphore))
+        for _, fetcher, _ in NEWS_SOURCES
+    ]
+
+    for (name, _, needed_below), task in zip(NEWS_SOURCES, tasks):
+        if len(all_news) >= needed_below:
+            if not task.cancel():
+                task.exception()  # Already finished, mark any error as retrieved
+            continue
         try:
-            # Use a simpler endpoint that doesn't require API key
-            url = "https://api.coingecko.com/api/v3/search/trending"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                trending_data = response.json()
-                coins = trending_data.get("coins", [])
-                for coin_info in coins[:5]:
-                    coin = coin_info.get("item", {})
-                    all_news.append({
-                        'title': f"Trending: {coin.get('name', 'Unknown')} ({coin.get('symbol', 'N/A')}) - Rank #{coin.get('market_cap_rank', 'N/A')}",
-                        'url': f"https://www.coingecko.com/en/coins/{coin.get('id', '')}",
-                        'published_at': datetime.now().isoformat(),
-                        'source': 'CoinGecko Trending'
-                    })
+            all_news.extend(await task)
         except Exception as e:
-            print(f"CoinGecko trending error: {e}")
-
-        # If still no news, try a different approach with sample crypto news
-        if len(all_news) == 0:
-            try:
-                # Create some sample news based on current market
-                sample_news = [
-                    {
-                        'title': 'Bitcoin and Ethereum Show Strong Market Activity',
-                        'url': 'https://www.coingecko.com',
-                        'published_at': datetime.now().isoformat(),
-                        'source': 'Market Update'
-                    },
-                    {
-                        'title': 'DeFi Protocols Continue to Gain Traction',
-                        'url': 'https://www.coingecko.com',
-                        'published_at': (datetime.now() - timedelta(hours=1)).isoformat(),
-                        'source': 'DeFi News'
-                    },
-                    {
-                        'title': 'Institutional Interest in Crypto Remains High',
-                        'url': 'https://www.coingecko.com',
-                        'published_at': (datetime.now() - timedelta(hours=2)).isoformat(),
-                        'source': 'Institutional News'
-                    }
-                ]
-                all_news.extend(sample_news)
-            except Exception as e:
-                print(f"Sample news error: {e}")
+            logger.warning(f"{name} error: {e}")
+
+    # If still no news, fall back to sample crypto news
+    if not all_news:
+        all_news.extend([
+            {
+                'title': 'Bitcoin and Ethereum Show Strong Market Activity',
+                'url': 'https://www.coingecko.com',
+                'published_at': datetime.now().isoformat(),
+                'source': 'Market Update'
+            },
+            {
+                'title': 'DeFi Protocols Continue to Gain Traction',
+                'url': 'https://www.coingecko.com',
+                'published_at': (datetime.now() - timedelta(hours=1)).isoformat(),
+                'source': 'DeFi News'
+            },
+            {
+                'title': 'Institutional Interest in Crypto Remains High',
+                'url': 'https://www.coingecko.com',
+                'published_at': (datetime.now() - timedelta(hours=2)).isoformat(),
+                'source': 'Institutional News'
+            }
+        ])
 
     return all_news[:15]  # Return max 15 articles
 
+# Display formats for order book levels
+ORDER_BOOK_FORMAT = {'Price ($)': '${:,.4f}', 'Quantity': '{:,.4f}'}
+ORDER_BOOK_DEPTH = 10
+
 async def fetch_order_book(coin):
     try:
         symbol = f"{coin}/USDT"
-        order_book = deriv_service.exchanges['binance'].fetch_order_book(symbol)
+        order_book = await svc.deriv.exchanges['binance'].fetch_order_book(symbol)
         return order_book
     except:
         return None
 
+def render_order_book_side(levels, depth=ORDER_BOOK_DEPTH):
+    """Render the top price levels of one side of the order book"""
+    # A handful of levels renders as a plain table, skipping the
+    # DataFrame/Arrow round-trip entirely
+    st.table({
+        col: list(map(fmt.format, values))
+        for (col, fmt), values in zip(ORDER_BOOK_FORMAT.items(), zip(*levels[:depth]))
+    })
+
+NEWS_CARD_TEMPLATE = (
+    '<div class="news-card">'
+    '<div class="news-title">{title}</div>'
+    '<div class="news-meta">{time_str} • {source} • '
+    '<a href="{url}" target="_blank" class="news-link">Read More</a>'
+    '</div>'
+    '</div>'
+)
+
+WHALE_CARD_TEMPLATE = (
+    '<div class="whale-activity {card_class}">'
+    '<strong>{symbol}</strong> • {activity} • {position} • {exchange} • {time_str}'
+    '</div>'
+)
+RAW_WHALE_CARD_TEMPLATE = '<div class="whale-activity">{text}</div>'
+
+def whale_card_classes(activities):
+    """'buy' for buys and opened positions, 'sell' for everything else"""
+    names = pd.Series(
+        [a.get('activity', 'unknown') if isinstance(a, dict) else None for a in activities], dtype='string'
+    ).str.lower()
+    is_buy = names.str.contains('buy|opened', regex=True).to_numpy(dtype=bool, na_value=False)
+    return np.where(is_buy, 'buy', 'sell')
+
+def render_whale_card(activity, time_str, card_class, position):
+    """HTML card for a single whale activity dict"""
+    return WHALE_CARD_TEMPLATE.format(
+        card_class=card_class,
+        symbol=activity.get('symbol', 'N/A'),
+        activity=activity.get('activity', 'Unknown Activity'),
+        position=position,
+        exchange=activity.get('exchange', 'Unknown'),
+        time_str=time_str
+    )
+
+def coin_values(mapping, coins):
+    """Float array of mapping values in coin order, with missing or None as 0"""
+    return np.fromiter((mapping.get(coin) or 0.0 for coin in coins), dtype=np.float64, count=len(coins))
+
 def create_metric_card(title, value, change=None):
     color_class = "positive" if change and change > 0 else "negative" if change and change < 0 else "neutral"
     change_text = f"({change:+.2f}%)" if change else ""
@@ -479,10 +303,34 @@ def create_metric_card(title, value, change=None):
     </div>
     """
 
+def render_metric_cards(metrics):
+    """Lay out (title, value) metric cards side by side in one row"""
+    for col, (title, value) in zip(st.columns(len(metrics)), metrics):
+        col.markdown(create_metric_card(title, value), unsafe_allow_html=True)
+
+# Whale tracker frame columns -> the activity dict keys the whale tab reads.
+# The tab shows dollar sizes, so position_size comes from Estimated_Value
+WHALE_RECORD_FIELDS = {
+    'Timestamp': 'timestamp',
+    'Symbol': 'symbol',
+    'Activity': 'activity',
+    'Estimated_Value': 'position_size',
+    'Exchange': 'exchange',
+    'Address': 'address'
+}
+
+def whale_frame_records(df):
+    """Whale tracker frame as the dashboard's activity dicts"""
+    records = df[list(WHALE_RECORD_FIELDS)].rename(columns=WHALE_RECORD_FIELDS)
+    records['timestamp'] = records['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S')
+    # Simulated feeds are marked per record, so the flag survives caching
+    records['simulated'] = bool(df.attrs.get('simulated', False))
+    return records.astype(object).where(records.notna(), None).to_dict('records')
+
 async def safe_get_whale_data(coins):
     """Safely fetch whale data with error handling"""
     try:
-        whale_data = await whale_tracker.get_recent_whale_activity(coins)
+        whale_data = await svc.whale.get_recent_whale_activity(coins)
         
         # Normalize the data structure
         if whale_data is None:
@@ -491,8 +339,7 @@ async def safe_get_whale_data(coins):
         if isinstance(whale_data, pd.DataFrame):
             if whale_data.empty:
                 return []
-            # Convert DataFrame to list of dicts
-            return whale_data.to_dict('records')
+            return whale_frame_records(whale_data)
         
         if isinstance(whale_data, list):
             return whale_data
@@ -500,13 +347,13 @@ async def safe_get_whale_data(coins):
         return []
         
     except Exception as e:
-        st.error(f"Whale data error: {str(e)}")
+        logger.error(f"Whale data error: {str(e)}")
         return []
 
 async def safe_get_whale_summary(coins):
     """Safely fetch whale summary with error handling"""
     try:
-        summary = await whale_tracker.get_whale_positions_summary(coins)
+        summary = await svc.whale.get_whale_positions_summary(coins)
         
         if summary is None:
             return {}
@@ -517,69 +364,172 @@ async def safe_get_whale_summary(coins):
         return {}
         
     except Exception as e:
-        st.error(f"Whale summary error: {str(e)}")
+        logger.error(f"Whale summary error: {str(e)}")
         return {}
 
+MOCK_WHALE_COUNT = 5
+MOCK_ACTIVITIES = ['Large Buy', 'Large Sell', 'Position Opened', 'Position Closed']
+MOCK_EXCHANGES = ['Binance', 'OKX', 'Bybit', 'FTX']
+
+_RNG = np.random.default_rng()
+
 def create_mock_whale_data(coins):
     """Create mock whale data for demonstration"""
-    import random
-    import time
-    
-    mock_data = []
-    activities = ['Large Buy', 'Large Sell', 'Position Opened', 'Position Closed']
-    exchanges = ['Binance', 'OKX', 'Bybit', 'FTX']
-    
-    for i in range(5):
-        coin = random.choice(coins)
-        activity = random.choice(activities)
-        size = random.randint(100000, 5000000)
-        exchange = random.choice(exchanges)
-        
-        mock_data.append({
-            'symbol': f"{coin}/USDT",
-            'activity': activity,
-            'position_size': size,
-            'exchange': exchange,
-            'timestamp': datetime.now().isoformat(),
-            'activity_type': 'buy' if 'Buy' in activity or 'Opened' in activity else 'sell'
-        })
-    
-    return mock_data
+    n = MOCK_WHALE_COUNT
+    picks = zip(
+        _RNG.choice(coins, n).tolist(),
+        _RNG.choice(MOCK_ACTIVITIES, n).tolist(),
+        _RNG.integers(100000, 5000000, n, endpoint=True).tolist(),
+        _RNG.choice(MOCK_EXCHANGES, n).tolist()
+    )
+    timestamp = datetime.now().isoformat()
+
+    return [{
+        'symbol': f"{coin}/USDT",
+        'activity': activity,
+        'position_size': size,
+        'exchange': exchange,
+        'timestamp': timestamp,
+        'activity_type': 'buy' if 'Buy' in activity or 'Opened' in activity else 'sell'
+    } for coin, activity, size, exchange in picks]
 
 def create_mock_whale_summary(coins):
     """Create mock whale summary for demonstration"""
-    import random
-    
-    summary = {}
-    for coin in coins:
-        long_pos = random.randint(10000000, 100000000)
-        short_pos = random.randint(5000000, 80000000)
-        
-        summary[coin] = {
-            'total_long_positions': long_pos,
-            'total_short_positions': short_pos,
-            'net_position': long_pos - short_pos,
-            'long_short_ratio': long_pos / short_pos if short_pos > 0 else 0,
-            'whale_count': random.randint(5, 25)
+    n = len(coins)
+    long_pos = _RNG.integers(10000000, 100000000, n, endpoint=True).tolist()
+    short_pos = _RNG.integers(5000000, 80000000, n, endpoint=True).tolist()
+    whale_count = _RNG.integers(5, 25, n, endpoint=True).tolist()
+
+    return {
+        coin: {
+            'total_long_positions': long,
+            'total_short_positions': short,
+            'net_position': long - short,
+            'long_short_ratio': long / short if short > 0 else 0,
+            'whale_count': count
         }
-    
-    return summary
+        for coin, long, short, count in zip(coins, long_pos, short_pos, whale_count)
+    }
+
+def make_coin_key(coins):
+    """Order-independent, hashable key for a coin selection"""
+    return tuple(sorted(set(coins)))
 
-async def render_dashboard():
+# Defaults for a dashboard source that failed, in gather order
+DASHBOARD_SOURCES = (
+    ('funding rates', {}),
+    ('open interest', {}),
+    ('perpetual data', {}),
+    ('basis', {}),
+    ('news', []),
+)
+
+async def gather_dashboard_data(coins, session):
+    """Fetch every independent dashboard source concurrently"""
+    results = await asyncio.gather(
+        svc.deriv.get_multi_coin_funding_rates(coins),
+        svc.deriv.get_multi_coin_open_interest(coins),
+        # Only the ticker fields the Overview and Markets tabs actually render
+        svc.deriv.get_perpetual_data(coins, fields=('mark_prices', 'volume_24h')),
+        svc.deriv.get_basis_data(coins),
+        fetch_news(session),
+        return_exceptions=True
+    )
+
+    data = []
+    for (name, default), result in zip(DASHBOARD_SOURCES, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error loading {name}: {result}")
+            result = default
+        data.append(result)
+
+    # Open interest is fetched once and shared with the perpetual data
+    funding, oi, perp_data, basis_data, news = data
+    perp_data = {**perp_data, 'open_interest': oi}
+    return funding, oi, perp_data, basis_data, news
+
+# Market data only changes on the order of a minute, so reruns triggered by
+# widget interaction are served from these caches instead of refetching
+# Each entry is a full payload for one coin selection, so keep fewer of them
+# than the per-figure caches below
+@st.cache_data(ttl=30, max_entries=16, show_spinner=False)
+def load_dashboard_data(coin_key):
+    return run_async(gather_dashboard_data(list(coin_key), get_http_session()))
+
+async def gather_whale_data(coins):
+    """Fetch recent whale activity and the positions summary concurrently"""
+    whale_data, whale_summary = await asyncio.gather(
+        safe_get_whale_data(coins),
+        safe_get_whale_summary(coins)
+    )
+    return whale_data, whale_summary
+
+# Whale flow moves faster than the derivatives metrics, so it expires sooner
+@st.cache_data(ttl=15, max_entries=16, show_spinner=False)
+def load_whale_data(coin_key):
+    return run_async(gather_whale_data(list(coin_key)))
+
+@st.cache_data(ttl=30, max_entries=32, show_spinner=False)
+def cached_order_book(coin):
+    return run_async(fetch_order_book(coin))
+
+WHALE_CHART_FIELDS = ('timestamp', 'symbol', 'activity', 'position_size')
+
+def whale_chart_frame(activities):
+    """Just the fields the whale chart plots, as a DataFrame"""
+    # Streamlit hashes a DataFrame's values in one vectorized pass, where a
+    # nested tuple key would be walked element by element on every rerun
+    frame = pd.DataFrame.from_records(activities, columns=WHALE_CHART_FIELDS)
+    # Fields no activity carries stay missing, as they were in the dicts
+    return frame.dropna(axis=1, how='all')
+
+# Figures are pure functions of their inputs, so identical data reuses the built figure
+@st.cache_data(ttl=30, max_entries=64, show_spinner=False)
+def cached_whale_chart(activities):
+    # Handed over column-wise, so the chart reads each field as one list
+    return create_whale_activity_chart(activities.to_dict('list'))
+
+@st.cache_data(ttl=30, max_entries=64, show_spinner=False)
+def cached_funding_chart(funding, coins):
+    return create_funding_chart(funding, list(coins))
+
+@st.cache_data(ttl=30, max_entries=64, show_spinner=False)
+def cached_open_interest_chart(open_interest, coins):
+    return create_open_interest_chart(open_interest, list(coins))
+
+def clear_market_cache():
+    """Drop cached market data so the next run refetches everything"""
+    for cached in (load_dashboard_data, load_whale_data, cached_order_book,
+                   cached_whale_chart, cached_funding_chart, cached_open_interest_chart):
+        cached.clear()
+
+# Display formats for the Markets table; funding and basis are already percentages
+MARKET_COLUMNS = {
+    'Mark Price': st.column_config.NumberColumn(format="$%.2f"),
+    'Funding Rate': st.column_config.NumberColumn(format="%.4f%%"),
+    '24h Volume': st.column_config.NumberColumn("24h Volume ($)", format="compact"),
+    'Open Interest': st.column_config.NumberColumn("Open Interest ($)", format="compact"),
+    'Basis': st.column_config.NumberColumn(format="%.2f%%"),
+}
+# Digits after the point each column shows; compact figures keep three significant digits
+MARKET_DECIMALS = {'Mark Price': 2, 'Funding Rate': 4, '24h Volume': 0, 'Open Interest': 0, 'Basis': 2}
+
+def render_dashboard(selected_coins):
     if not selected_coins:
         st.warning("⚠️ Please select at least one cryptocurrency from the sidebar")
         return
     
+    # Canonical selection so reordering the multiselect maps onto the same cache entries
+    coin_key = make_coin_key(selected_coins)
+
     with st.spinner("🔄 Loading market data..."):
-        # Fetch all data
-        funding = await deriv_service.get_multi_coin_funding_rates(selected_coins)
-        oi = await deriv_service.get_multi_coin_open_interest(selected_coins)
-        perp_data = await deriv_service.get_perpetual_data(selected_coins)
-        basis_data = await deriv_service.get_basis_data(selected_coins)
-        news = await fetch_news()
-        
-        # Safely fetch whale data
-        whale_data = await safe_get_whale_data(selected_coins)
+        funding, oi, perp_data, basis_data, news = load_dashboard_data(coin_key)
+        whale_data, whale_summary = load_whale_data(coin_key)
+
+    # Per-coin arrays shared by the Overview metrics and the Markets table
+    rate = coin_values(funding, selected_coins)
+    open_interest = coin_values(perp_data.get('open_interest', {}), selected_coins)
+    has_rate = np.fromiter((coin in funding for coin in selected_coins), dtype=bool, count=len(selected_coins))
 
     # Main dashboard tabs
     tabs = st.tabs([
@@ -596,23 +546,17 @@ async def render_dashboard():
         
         # Key metrics row
         if funding and perp_data:
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                avg_funding = sum(funding.values()) / len(funding) * 100
-                st.markdown(create_metric_card("Avg Funding Rate", f"{avg_funding:.3f}%"), unsafe_allow_html=True)
-            
-            with col2:
-                total_oi = sum(perp_data.get('open_interest', {}).values()) / 1e9
-                st.markdown(create_metric_card("Total OI", f"${total_oi:.2f}B"), unsafe_allow_html=True)
-            
-            with col3:
-                whale_count = len(whale_data) if whale_data else 0
-                st.markdown(create_metric_card("Whale Activities", f"{whale_count}"), unsafe_allow_html=True)
-            
-            with col4:
-                active_pairs = len([c for c in selected_coins if c in funding])
-                st.markdown(create_metric_card("Active Pairs", f"{active_pairs}"), unsafe_allow_html=True)
+            avg_funding = float(np.nanmean(rate[has_rate]))
+            total_oi = float(np.nansum(open_interest)) / 1e9
+            whale_count = len(whale_data) if whale_data else 0
+            active_pairs = int(has_rate.sum())
+
+            render_metric_cards([
+                ("Avg Funding Rate", f"{avg_funding:.3f}%"),
+                ("Total OI", f"${total_oi:.2f}B"),
+                ("Whale Activities", f"{whale_count}"),
+                ("Active Pairs", f"{active_pairs}")
+            ])
         
         st.markdown("---")
         
@@ -621,31 +565,36 @@ async def render_dashboard():
         with col1:
             st.markdown("#### 💰 Funding Rates")
             if funding and len(funding) > 0:
-                st.plotly_chart(create_funding_chart(funding, selected_coins), use_container_width=True)
+                st.plotly_chart(cached_funding_chart(funding, tuple(selected_coins)), use_container_width=True)
         
         with col2:
             st.markdown("#### 📊 Open Interest")
             if oi and len(oi) > 0:
-                st.plotly_chart(create_open_interest_chart(oi, selected_coins), use_container_width=True)
+                st.plotly_chart(cached_open_interest_chart(oi, tuple(selected_coins)), use_container_width=True)
 
     with tabs[1]:
         st.markdown("### 💹 Spot & Futures Markets")
         
         if perp_data and funding and len(funding) > 0:
-            market_data = []
-            for coin in selected_coins:
-                row = {
-                    'Symbol': f"{coin}/USDT",
-                    'Mark Price': f"${perp_data.get('mark_prices', {}).get(coin, 0):,.2f}",
-                    'Funding Rate': f"{funding.get(coin, 0)*100:.4f}%",
-                    '24h Volume': f"${perp_data.get('volume_24h', {}).get(coin, 0) or 0/1e6:.1f}M",
-                    'Open Interest': f"${perp_data.get('open_interest', {}).get(coin, 0)/1e6:.1f}M",
-                    'Basis': f"{basis_data.get(coin, 0):.2f}%" if basis_data and basis_data.get(coin) else "N/A"
-                }
-                market_data.append(row)
-            
-            df = pd.DataFrame(market_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            # One array per column (funding and OI shared with the Overview), then whole-column formatting
+            coins = np.asarray(selected_coins)
+            mark = coin_values(perp_data.get('mark_prices', {}), selected_coins)
+            volume = coin_values(perp_data.get('volume_24h', {}), selected_coins)
+            basis = coin_values(basis_data or {}, selected_coins)
+
+            # Raw numbers go to the frontend, which formats them per MARKET_COLUMNS
+            df = pd.DataFrame({
+                'Symbol': np.char.add(coins, '/USDT'),
+                'Mark Price': mark,
+                'Funding Rate': rate,
+                '24h Volume': volume,
+                'Open Interest': open_interest,
+                # Missing basis shows as an empty cell
+                'Basis': np.where(basis != 0, basis, np.nan)
+            })
+            df = downcast_for_display(df, MARKET_DECIMALS)
+            st.dataframe(df, key="market_tbl", use_container_width=True, hide_index=True,
+                         column_config=MARKET_COLUMNS)
         else:
             st.error("❌ Unable to fetch market data")
 
@@ -658,29 +607,28 @@ async def render_dashboard():
             col1, col2 = st.columns([3, 1])
             with col2:
                 if st.button("🔄 Refresh Order Book"):
+                    cached_order_book.clear()
                     st.rerun()
             
             with st.spinner(f"📊 Loading {coin} order book..."):
-                ob = await fetch_order_book(coin)
+                ob = cached_order_book(coin)
                 
             if ob:
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.markdown("#### 🟢 Top Bids")
-                    bids_df = pd.DataFrame(ob['bids'][:10], columns=["Price ($)", "Quantity"])
-                    bids_df['Price ($)'] = bids_df['Price ($)'].apply(lambda x: f"${x:,.4f}")
-                    st.dataframe(bids_df, use_container_width=True, hide_index=True)
-                
+                    render_order_book_side(ob['bids'])
+
                 with col2:
                     st.markdown("#### 🔴 Top Asks")
-                    asks_df = pd.DataFrame(ob['asks'][:10], columns=["Price ($)", "Quantity"])
-                    asks_df['Price ($)'] = asks_df['Price ($)'].apply(lambda x: f"${x:,.4f}")
-                    st.dataframe(asks_df, use_container_width=True, hide_index=True)
+                    render_order_book_side(ob['asks'])
                 
                 # Order book visualization
-                spread = ob['asks'][0][0] - ob['bids'][0][0]
-                spread_pct = (spread / ob['bids'][0][0]) * 100
+                best_ask = ob['asks'][0][0]
+                best_bid = ob['bids'][0][0]
+                spread = best_ask - best_bid
+                spread_pct = spread * 100.0 / best_bid
                 st.markdown(f"**Spread:** ${spread:.4f} ({spread_pct:.3f}%)")
             else:
                 st.error("❌ Failed to fetch order book data")
@@ -696,8 +644,14 @@ async def render_dashboard():
                 st.rerun()
 
         # Show data source info
+        simulated = bool(whale_data) and any(
+            isinstance(a, dict) and a.get('simulated') for a in whale_data
+        )
         if whale_data and len(whale_data) > 0 and not use_mock_data:
-            st.success("✅ Using real whale tracking data from exchanges")
+            if simulated:
+                st.info("📊 Showing simulated whale activity - live whale feeds returned no data")
+            else:
+                st.success("✅ Using real whale tracking data from exchanges")
         elif use_mock_data:
             st.info("📊 Showing demo whale activity data")
         else:
@@ -711,44 +665,33 @@ async def render_dashboard():
         if whale_data and len(whale_data) > 0:
             st.markdown(f"**Recent Activities:** {len(whale_data)} transactions detected")
             
-            # Whale activity cards
-            for activity in whale_data[:10]:
-                if isinstance(activity, dict):
-                    activity_type = activity.get('activity', 'unknown').lower()
-                    card_class = 'buy' if ('buy' in activity_type or 'opened' in activity_type) else 'sell'
-                    
-                    symbol = activity.get('symbol', 'N/A')
-                    activity_name = activity.get('activity', 'Unknown Activity')
-                    position_size = activity.get('position_size', 0)
-                    exchange = activity.get('exchange', 'Unknown')
-                    timestamp = activity.get('timestamp', '')
-                    
-                    try:
-                        time_str = pd.to_datetime(timestamp).strftime('%H:%M:%S') if timestamp else 'N/A'
-                    except:
-                        time_str = 'N/A'
-                    
-                    st.markdown(f"""
-                    <div class="whale-activity {card_class}">
-                        <strong>{symbol}</strong> • 
-                        {activity_name} • 
-                        ${position_size:,.0f} • 
-                        {exchange} • 
-                        {time_str}
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div class="whale-activity">
-                        {str(activity)[:100]}
-                    </div>
-                    """, unsafe_allow_html=True)
+            # Whale activity cards, rendered as one markdown block
+            recent = whale_data[:10]
+            times = pd.to_datetime(
+                pd.Series([a.get('timestamp') if isinstance(a, dict) else None for a in recent], dtype=object),
+                errors='coerce'
+            ).dt.strftime('%H:%M:%S').fillna('N/A')
+            card_classes = whale_card_classes(recent)
+            positions = format_money_compact(
+                [(a.get('position_size') or 0) if isinstance(a, dict) else 0 for a in recent]
+            )
+
+            # One pass builds the cards for the first ten and collects the chartable activities
+            cards = []
+            dict_activities = []
+            for i, activity in enumerate(whale_data):
+                is_dict = isinstance(activity, dict)
+                if is_dict and 'position_size' in activity:
+                    dict_activities.append(activity)
+                if i < len(recent):
+                    cards.append(render_whale_card(activity, times[i], card_classes[i], positions[i]) if is_dict
+                                 else RAW_WHALE_CARD_TEMPLATE.format(text=str(activity)[:100]))
+            st.markdown("".join(cards), unsafe_allow_html=True)
             
             # Try to create whale activity chart if we have proper data
             try:
-                dict_activities = [a for a in whale_data if isinstance(a, dict) and 'position_size' in a]
                 if len(dict_activities) > 1:
-                    st.plotly_chart(create_whale_activity_chart(dict_activities), use_container_width=True)
+                    st.plotly_chart(cached_whale_chart(whale_chart_frame(dict_activities)), use_container_width=True)
             except Exception as e:
                 st.info("📊 Chart unavailable - insufficient data format")
         else:
@@ -764,12 +707,14 @@ async def render_dashboard():
             if st.button("🔄 Refresh Accumulation"):
                 st.rerun()
 
-        with st.spinner("🔍 Analyzing whale positions..."):
-            summary = await safe_get_whale_summary(selected_coins)
+        summary = whale_summary
 
         # Show data source info
         if summary and len(summary) > 0 and not use_mock_summary:
-            st.success("✅ Using real accumulation data from exchanges and on-chain sources")
+            if any(isinstance(data, dict) and data.get('simulated') for data in summary.values()):
+                st.info("📊 Showing simulated accumulation data - live accumulation sources returned no data")
+            else:
+                st.success("✅ Using real accumulation data from exchanges and on-chain sources")
         elif use_mock_summary:
             st.info("📊 Showing demo accumulation data")
         else:
@@ -781,41 +726,40 @@ async def render_dashboard():
             summary = create_mock_whale_summary(selected_coins)
         
         if summary and len(summary) > 0:
-            acc_data = []
-            for coin, data in summary.items():
-                if isinstance(data, dict):
-                    total_long = data.get('total_long_positions', 0)
-                    total_short = data.get('total_short_positions', 0)
-                    net_pos = data.get('net_position', total_long - total_short)
-                    ls_ratio = data.get('long_short_ratio', 
-                                     total_long / total_short if total_short > 0 else 0)
-                    whale_count = data.get('whale_count', 0)
-                    
-                    acc_data.append({
-                        'Asset': coin,
-                        'Long Positions': f"${total_long/1e6:.1f}M",
-                        'Short Positions': f"${total_short/1e6:.1f}M",
-                        'Net Position': f"${net_pos/1e6:.1f}M",
-                        'L/S Ratio': f"{ls_ratio:.2f}",
-                        'Active Whales': whale_count
-                    })
-            
-            if acc_data:
-                df = pd.DataFrame(acc_data)
-                st.dataframe(df, use_container_width=True, hide_index=True)
+            sdf = pd.DataFrame.from_dict(
+                {coin: data for coin, data in summary.items() if isinstance(data, dict)}, orient='index'
+            ).reindex(columns=['total_long_positions', 'total_short_positions', 'net_position', 'long_short_ratio', 'whale_count'])
+
+            if not sdf.empty:
+                total_long = sdf['total_long_positions'].fillna(0)
+                total_short = sdf['total_short_positions'].fillna(0)
+                net_pos = sdf['net_position'].fillna(total_long - total_short)
+                ls_ratio = sdf['long_short_ratio'].fillna((total_long / total_short).where(total_short > 0, 0))
+
+                df = pd.DataFrame({
+                    'Asset': sdf.index,
+                    'Long Positions': format_money_compact(total_long),
+                    'Short Positions': format_money_compact(total_short),
+                    'Net Position': format_money_compact(net_pos),
+                    'L/S Ratio': ls_ratio.map('{:.2f}'.format),
+                    'Active Whales': sdf['whale_count'].fillna(0).astype(int)
+                })
+                st.dataframe(df, key="whale_tbl", use_container_width=True, hide_index=True)
                 
-                # Add summary metrics
-                total_net = sum([summary[coin].get('net_position', 0) for coin in selected_coins if coin in summary])
-                avg_ratio = sum([summary[coin].get('long_short_ratio', 0) for coin in selected_coins if coin in summary]) / len(summary)
-                total_whales = sum([summary[coin].get('whale_count', 0) for coin in selected_coins if coin in summary])
+                # Add summary metrics, reduced column-wise over the selected coins
+                totals = sdf.reindex(
+                    index=sdf.index.intersection(selected_coins),
+                    columns=['net_position', 'long_short_ratio', 'whale_count']
+                ).fillna(0)
+                total_net = totals['net_position'].sum()
+                avg_ratio = totals['long_short_ratio'].sum() / len(summary)
+                total_whales = int(totals['whale_count'].sum())
                 
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown(create_metric_card("Total Net Position", f"${total_net/1e6:.1f}M"), unsafe_allow_html=True)
-                with col2:
-                    st.markdown(create_metric_card("Avg L/S Ratio", f"{avg_ratio:.2f}"), unsafe_allow_html=True)
-                with col3:
-                    st.markdown(create_metric_card("Total Whales", f"{total_whales}"), unsafe_allow_html=True)
+                render_metric_cards([
+                    ("Total Net Position", f"${total_net/1e6:.1f}M"),
+                    ("Avg L/S Ratio", f"{avg_ratio:.2f}"),
+                    ("Total Whales", f"{total_whales}")
+                ])
             else:
                 st.info("📊 No accumulation data available")
         else:
@@ -826,33 +770,24 @@ async def render_dashboard():
         
         if news and len(news) > 0:
             st.success(f"📰 Found {len(news)} recent crypto news articles")
-            for article in news[:15]:
-                source = article.get('source', 'Unknown')
-                title = article.get('title', 'No title')
-                url = article.get('url', '#')
-                published_at = article.get('published_at', '')
-
-                # Format the timestamp
-                try:
-                    if published_at:
-                        if 'T' in published_at:
-                            time_str = published_at.split('T')[0] + ' ' + published_at.split('T')[1][:5]
-                        else:
-                            time_str = published_at[:16]
-                    else:
-                        time_str = 'Unknown time'
-                except:
-                    time_str = 'Unknown time'
-
-                st.markdown(f"""
-                <div class="news-card">
-                    <div class="news-title">{title}</div>
-                    <div class="news-meta">
-                        {time_str} • {source} •
-                        <a href="{url}" target="_blank" class="news-link">Read More</a>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            cards = []
+            articles = news[:15]
+            # Parse every timestamp in one pass; anything unparseable shows as unknown
+            times = pd.to_datetime(
+                [article.get('published_at') or None for article in articles],
+                format='ISO8601', utc=True, errors='coerce'
+            ).strftime('%Y-%m-%d %H:%M').fillna('Unknown time')
+
+            for article, time_str in zip(articles, times):
+                cards.append(NEWS_CARD_TEMPLATE.format(
+                    title=article.get('title', 'No title'),
+                    time_str=time_str,
+                    source=article.get('source', 'Unknown'),
+                    url=article.get('url', '#')
+                ))
+
+            # One markdown element for the whole feed instead of one per article
+            st.markdown("".join(cards), unsafe_allow_html=True)
         else:
             st.warning("📡 No news data available. Please check your API configuration.")
             st.info("""
@@ -862,22 +797,27 @@ async def render_dashboard():
             - CoinGecko news works without API key (backup source)
             """)
 
+@st.fragment(run_every=60)
+def live_dashboard(selected_coins):
+    """Dashboard panels that refresh on their own, leaving the chrome and sidebar untouched"""
+    render_dashboard(selected_coins)
+
 # Main execution
 if __name__ == '__main__':
+    selected_coins, auto_refresh = render_chrome()
+
     if auto_refresh:
-        # Auto-refresh every 60 seconds
-        asyncio.run(render_dashboard())
-        import time
-        time.sleep(60)
-        st.rerun()
+        # Auto-refresh every 60 seconds by rerunning only the dashboard fragment
+        live_dashboard(selected_coins)
     else:
         # Manual refresh
         col1, col2, col3 = st.columns([1, 1, 4])
         with col1:
             if st.button("🔄 Refresh Dashboard"):
+                clear_market_cache()
                 st.rerun()
         with col2:
             if st.button("⚡ Quick Update"):
                 st.rerun()
         
-        asyncio.run(render_dashboard())
\ No newline at end of file
+        render_dashboard(selected_coins)
\ No newline at end of file
@@ -1,12 +1,17 @@
 # utils/enhanced_plots.py
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 import numpy as np
 from datetime import datetime, timedelta
-import plotly.graph_objs as go
+from functools import lru_cache, wraps
+import math
+# Trace values ship as float32 where they still format to the same digits
+# at the precision their hover or labels show, halving their JSON share
+from utils.formatting import downcast_array_for_display
 
 # Discord-inspired color palette
 DISCORD_COLORS = {
@@ -22,123 +27,229 @@ DISCORD_COLORS = {
     'muted': '#72767d'
 }
 
+def _freeze(value):
+    """Hashable snapshot of a chart input"""
+    # Items keep their order, since trace order follows dict and list order
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, pd.DataFrame):
+        row_hashes = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        return (tuple(value.columns), tuple(map(str, value.dtypes)), row_hashes.tobytes())
+    return value
+
+class _ArgsKey:
+    """Cache key wrapping a call's arguments, compared by their frozen snapshot"""
+    __slots__ = ('args', 'kwargs', 'key', 'hash')
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.key = (_freeze(args), _freeze(kwargs))
+        self.hash = hash(self.key)  # Raises TypeError for unhashable payloads
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return isinstance(other, _ArgsKey) and self.key == other.key
+
+def _memoized(compute):
+    """LRU-memoize compute on a frozen snapshot of its arguments"""
+    @lru_cache(maxsize=256)
+    def cached(key):
+        return compute(*key.args, **key.kwargs)
+
+    def wrapper(*args, **kwargs):
+        try:
+            key = _ArgsKey(args, kwargs)
+        except TypeError:
+            return compute(*args, **kwargs)
+        return cached(key)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+def _memoize_chart(build):
+    """Memoize a pure chart builder so identical inputs reuse the built figure"""
+    # Figures are shared between callers with equal inputs, so treat them as read-only
+    return wraps(build)(_memoized(build))
+
+def figure_to_json(fig: go.Figure) -> str:
+    """Serialize a figure to compact JSON without re-validating it"""
+    # Built figures are already validated, so skip the second pass. orjson
+    # (a requirement) encodes numpy arrays in C; plotly's own path handles
+    # the pandas and datetime values orjson can't take directly
+    return pio.to_json(fig, validate=False, pretty=False, engine='orjson')
+
+def _json_variant(chart):
+    """Memoized variant of a chart builder that returns the serialized figure"""
+    # Only the JSON is cached: the figure is built with the unmemoized builder,
+    # so JSON callers don't also pin a Figure per input in the chart's cache
+    build = getattr(chart, '__wrapped__', chart)
+    wrapper = _memoized(lambda *args, **kwargs: figure_to_json(build(*args, **kwargs)))
+    wrapper.__name__ = f"{chart.__name__}_json"
+    wrapper.__doc__ = f"{chart.__name__}, serialized to JSON"
+    return wrapper
+
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple"""
     hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    if len(hex_color) < 6:
+        raise ValueError(f"Expected #RRGGBB or #RRGGBBAA, got {hex_color!r}")
+    # bytes.fromhex parses all three channels in C; any alpha digits are ignored
+    return tuple(bytes.fromhex(hex_color[:6]))
+
+# Palette as RGB tuples and 10%-opacity fills, parsed once at import
+DISCORD_RGB = {name: hex_to_rgb(color) for name, color in DISCORD_COLORS.items()}
+DISCORD_RGBA_10 = {name: f"rgba({r}, {g}, {b}, 0.1)" for name, (r, g, b) in DISCORD_RGB.items()}
+
+_AXIS_STYLE = dict(
+    tickfont=dict(color=DISCORD_COLORS['light']),
+    gridcolor=DISCORD_COLORS['muted'],
+    gridwidth=0.5
+)
+
+# Theme shared by every chart; margins vary, so they are set per chart. The
+# values stay at layout level, where they win over st.plotly_chart's theme
+_THEME_LAYOUT = dict(
+    plot_bgcolor=DISCORD_COLORS['dark'],
+    paper_bgcolor=DISCORD_COLORS['darker'],
+    font=dict(family="Whitney", color=DISCORD_COLORS['light'])
+)
+
+# The same theme as an opt-in template over the current default, for figures
+# built outside this module; the charts here don't reference it
+pio.templates['discord'] = pio.templates.merge_templates(
+    pio.templates.default,
+    go.layout.Template(layout=dict(**_THEME_LAYOUT, xaxis=_AXIS_STYLE, yaxis=_AXIS_STYLE))
+)
+
+# Layout skeleton of the single-series cartesian charts
+_BASE_LAYOUT = dict(
+    **_THEME_LAYOUT,
+    hovermode='x unified',
+    showlegend=False,
+    margin=dict(t=50, b=50, l=50, r=50)
+)
+
+def _axis(title: str, **overrides) -> Dict:
+    """Themed axis with a title"""
+    return {**_AXIS_STYLE, 'title': dict(text=title, font=dict(color=DISCORD_COLORS['light'])), **overrides}
+
+def _title(text: str, size: int = 18) -> Dict:
+    """Centered chart title in the theme font"""
+    return dict(text=text, font=dict(size=size, color=DISCORD_COLORS['light'], family="Whitney"), x=0.5)
+
+# The dashed y=0 reference line fig.add_hline(y=0, ...) would add, as a layout shape
+_ZERO_LINE = dict(
+    type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+    line=dict(dash='dash', color=DISCORD_COLORS['muted']), opacity=0.5
+)
+
+# Trace styles that never vary, shared by reference (figures copy their input)
+_HISTORY_LINE = dict(color=DISCORD_COLORS['primary'], width=2)
+_HISTORY_MARKER = dict(size=4, color=DISCORD_COLORS['primary'])
+_VOLUME_LINE = dict(width=2)
+_WHALE_MARKER_LINE = dict(width=2, color=DISCORD_COLORS['light'])
+
+def _figure(data: List[Dict], layout: Dict) -> go.Figure:
+    """Figure from plain dict traces and layout, skipping graph_objs validation"""
+    return go.Figure(data=data, layout=layout, _validate=False)
 
 def create_empty_chart(message: str) -> go.Figure:
     """Create an empty chart with a message"""
-    fig = go.Figure()
-    fig.add_annotation(
-        text=message,
-        x=0.5, y=0.5,
-        xref="paper", yref="paper",
-        font=dict(size=16, color=DISCORD_COLORS['muted']),
-        showarrow=False
-    )
-    fig.update_layout(
+    return _figure([], dict(
+        annotations=[dict(
+            text=message,
+            x=0.5, y=0.5,
+            xref="paper", yref="paper",
+            font=dict(size=16, color=DISCORD_COLORS['muted']),
+            showarrow=False
+        )],
         plot_bgcolor=DISCORD_COLORS['dark'],
         paper_bgcolor=DISCORD_COLORS['darker'],
         xaxis=dict(visible=False),
         yaxis=dict(visible=False),
         margin=dict(t=50, b=50, l=50, r=50)
-    )
-    return fig
+    ))
 
+@_memoize_chart
 def create_funding_chart(funding_rates: Dict[str, float], coins: List[str]) -> go.Figure:
     """Create a modern funding rates chart with Discord theme"""
     
-    # Filter and sort data
-    filtered_rates = {coin: funding_rates.get(coin, 0) for coin in coins if coin in funding_rates}
+    # Selected coins with a rate, each once and in selection order
+    coins_list = [coin for coin in dict.fromkeys(coins) if coin in funding_rates]
     
-    if not filtered_rates:
+    if not coins_list:
         return create_empty_chart("No funding rate data available")
     
-    # Prepare data
-    coins_list = list(filtered_rates.keys())
-    rates_list = list(filtered_rates.values())
-    
-    # Color based on rate direction
-    colors = [DISCORD_COLORS['success'] if rate >= 0 else DISCORD_COLORS['danger'] for rate in rates_list]
-    
-    fig = go.Figure()
-    
-    # Add bar chart
-    fig.add_trace(go.Bar(
-        x=coins_list,
-        y=rates_list,
-        marker_color=colors,
-        text=[f"{rate:.4f}%" for rate in rates_list],
+    return _funding_builder(tuple(coins_list))([funding_rates[coin] for coin in coins_list])
+
+@lru_cache(maxsize=64)
+def _funding_builder(coins: tuple):
+    """Funding chart builder for one coin list, with everything rate-independent prebuilt"""
+    # Dashboards re-request the same coin list on every refresh, so the trace
+    # skeleton and the layout are assembled once per list and reused
+    bar_base = dict(
+        type='bar',
+        x=list(coins),
         textposition='outside',
         textfont=dict(color=DISCORD_COLORS['light'], size=12),
         hovertemplate='<b>%{x}</b><br>Funding Rate: %{y:.4f}%<extra></extra>',
         name='Funding Rate'
-    ))
-    
-    # Add zero line
-    fig.add_hline(y=0, line_dash="dash", line_color=DISCORD_COLORS['muted'], opacity=0.5)
-    
-    # Update layout with Discord theme - FIXED: titlefont -> title with font
-    fig.update_layout(
-        title=dict(
-            text="💰 Funding Rates by Asset",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Assets",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Funding Rate (%)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5,
-            zeroline=True,
-            zerolinecolor=DISCORD_COLORS['muted']
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
-        hovermode='x unified',
-        showlegend=False,
-        margin=dict(t=50, b=50, l=50, r=50)
     )
+    # Layout with Discord theme and the zero line
+    layout = dict(
+        title=_title("💰 Funding Rates by Asset"),
+        xaxis=_axis("Assets"),
+        yaxis=_axis("Funding Rate (%)", zeroline=True, zerolinecolor=DISCORD_COLORS['muted']),
+        **_BASE_LAYOUT,
+        shapes=[_ZERO_LINE]
+    )
+    
+    def build(rates: List[float]) -> go.Figure:
+        values = np.asarray(rates, dtype=np.float64)
+        bar = dict(
+            bar_base,
+            y=downcast_array_for_display(values, 4),
+            # Color based on rate direction
+            marker=dict(color=np.where(values >= 0, DISCORD_COLORS['success'], DISCORD_COLORS['danger'])),
+            text=np.char.mod('%.4f%%', values)
+        )
+        return _figure([bar], layout)
     
-    return fig
+    return build
 
+@_memoize_chart
 def create_open_interest_chart(open_interest: Dict[str, float], coins: List[str]) -> go.Figure:
     """Create an open interest donut chart with Discord theme"""
     
-    # Filter and prepare data
-    filtered_oi = {coin: open_interest.get(coin, 0) for coin in coins if coin in open_interest and open_interest.get(coin, 0) > 0}
+    # One lookup per coin (each coin once) into an array, keeping positive OI
+    unique_coins = list(dict.fromkeys(coins))
+    values = np.fromiter(
+        (open_interest.get(coin, 0) for coin in unique_coins), dtype=np.float64, count=len(unique_coins)
+    )
+    positive = np.flatnonzero(values > 0)
     
-    if not filtered_oi:
+    if not positive.size:
         return create_empty_chart("No open interest data available")
     
-    # Sort by value for better visualization
-    sorted_oi = dict(sorted(filtered_oi.items(), key=lambda x: x[1], reverse=True))
-    
-    coins_list = list(sorted_oi.keys())
-    oi_values = list(sorted_oi.values())
+    # Sort by value for better visualization; stable, so ties keep selection order
+    order = positive[np.argsort(-values[positive], kind='stable')]
+    coins_list = [unique_coins[i] for i in order.tolist()]
+    oi_values = values[order]
     
     # Generate colors
     colors = px.colors.qualitative.Set3[:len(coins_list)]
     
-    fig = go.Figure()
-    
-    # Add donut chart
-    fig.add_trace(go.Pie(
+    # Donut chart
+    pie = dict(
+        type='pie',
         labels=coins_list,
+        # Kept float64: shares are derived from the values in the browser, so
+        # there is no fixed number of displayed digits to check against
         values=oi_values,
         hole=0.4,
         marker=dict(colors=colors, line=dict(color=DISCORD_COLORS['darker'], width=2)),
@@ -146,26 +257,21 @@ def create_open_interest_chart(open_interest: Dict[str, float], coins: List[str]
         hovertemplate='<b>%{label}</b><br>OI: $%{value:,.0f}<br>Share: %{percent}<extra></extra>',
         textinfo='label+percent',
         textposition='outside'
-    ))
+    )
     
-    # Add center text
-    total_oi = sum(oi_values)
-    fig.add_annotation(
+    # Center text
+    total_oi = math.fsum(oi_values.tolist())
+    center = dict(
         text=f"<b>Total OI</b><br>${total_oi/1e9:.2f}B",
         x=0.5, y=0.5,
         font=dict(size=16, color=DISCORD_COLORS['light'], family="Whitney"),
         showarrow=False
     )
     
-    fig.update_layout(
-        title=dict(
-            text="📊 Open Interest Distribution",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
+    return _figure([pie], dict(
+        title=_title("📊 Open Interest Distribution"),
+        annotations=[center],
+        **_THEME_LAYOUT,
         showlegend=True,
         legend=dict(
             orientation="v",
@@ -176,363 +282,339 @@ def create_open_interest_chart(open_interest: Dict[str, float], coins: List[str]
             font=dict(color=DISCORD_COLORS['light'])
         ),
         margin=dict(t=50, b=50, l=50, r=50)
-    )
-    
-    return fig
+    ))
+
+# Whale feeds with more events than this are binned before plotting
+WHALE_BIN_MIN_POINTS = 500
+WHALE_BIN = '5min'
+
+# Fields the whale chart plots, with the value used where an activity lacks one
+_WHALE_FIELD_DEFAULTS = {'timestamp': None, 'symbol': '', 'activity': '', 'position_size': np.nan}
 
-def create_whale_activity_chart(whale_data: List[Dict]) -> go.Figure:
-    """Create whale activity timeline chart"""
+@_memoize_chart
+def create_whale_activity_chart(whale_data: Union[List[Dict], Dict[str, List]]) -> go.Figure:
+    """Create whale activity timeline chart from activity dicts or field columns"""
     
     if not whale_data:
         return create_empty_chart("No whale activity data available")
     
-    # Convert to DataFrame for easier processing
-    df = pd.DataFrame(whale_data)
-    
     # Ensure we have required columns
-    required_cols = ['timestamp', 'symbol', 'activity', 'position_size']
-    if not all(col in df.columns for col in required_cols):
-        return create_empty_chart("Incomplete whale activity data")
-    
-    # Convert timestamp and sort
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df = df.sort_values('timestamp')
-    
-    # Create color mapping
-    df['color'] = df['activity'].apply(lambda x: 
-        DISCORD_COLORS['success'] if 'buy' in x.lower() else 
-        DISCORD_COLORS['danger'] if 'sell' in x.lower() else 
-        DISCORD_COLORS['warning']
-    )
+    if isinstance(whale_data, dict):
+        # Already columnar (field -> values, as DataFrame.to_dict('list') gives)
+        if not all(col in whale_data for col in _WHALE_FIELD_DEFAULTS):
+            return create_empty_chart("Incomplete whale activity data")
+        columns = whale_data
+    else:
+        if not all(any(col in activity for activity in whale_data) for col in _WHALE_FIELD_DEFAULTS):
+            return create_empty_chart("Incomplete whale activity data")
+        # Payloads are small, so the columns are pulled straight from the dicts
+        # instead of paying for a DataFrame
+        columns = {
+            col: [activity.get(col, default) for activity in whale_data]
+            for col, default in _WHALE_FIELD_DEFAULTS.items()
+        }
     
-    fig = go.Figure()
+    if not len(columns['timestamp']):
+        return create_empty_chart("No whale activity data available")
     
-    # Add scatter plot for whale activities
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['position_size'],
+    stamps = pd.Index(columns['timestamp'])
+    
+    # Convert timestamps and sort. An explicit format keeps pandas off the
+    # per-element dateutil parser; numeric timestamps are epoch milliseconds
+    if pd.api.types.is_numeric_dtype(stamps):
+        times = pd.to_datetime(stamps, unit='ms', cache=True, errors='coerce')
+    else:
+        times = pd.to_datetime(stamps, format='ISO8601', cache=True, errors='coerce')
+    order = np.argsort(times.to_numpy(), kind='stable')
+    times = times[order]
+    
+    sizes = np.asarray(columns['position_size'], dtype=np.float64)[order]
+    symbols = np.array([str(symbol) for symbol in columns['symbol']])[order]
+    actions = np.array([str(action) for action in columns['activity']])[order]
+    
+    # Busy feeds get one marker per (activity, symbol, time bin) sized by the
+    # summed position, which keeps the picture with far fewer markers. Input
+    # is time-sorted, so the groups come out in time order already
+    if len(sizes) > WHALE_BIN_MIN_POINTS:
+        binned = pd.DataFrame({
+            'activity': actions, 'symbol': symbols, 'tbin': times.floor(WHALE_BIN), 'position_size': sizes
+        }).groupby(['activity', 'symbol', 'tbin'], sort=False, dropna=False, as_index=False)['position_size'].sum(min_count=1)
+        times = pd.DatetimeIndex(binned['tbin'])
+        sizes = binned['position_size'].to_numpy(dtype=np.float64)
+        symbols = binned['symbol'].to_numpy(dtype=str)
+        actions = binned['activity'].to_numpy(dtype=str)
+    
+    # Color, marker size and hover text computed over whole arrays
+    lowered = np.char.lower(actions)
+    colors = np.where(
+        np.char.find(lowered, 'buy') >= 0, DISCORD_COLORS['success'],
+        np.where(np.char.find(lowered, 'sell') >= 0, DISCORD_COLORS['danger'], DISCORD_COLORS['warning'])
+    )
+    hover_text = np.char.add(
+        np.char.add(np.char.add(symbols, '<br>'), np.char.add(actions, '<br>$')),
+        np.array([f"{size:,.0f}" for size in sizes.tolist()])
+    )
+    
+    # WebGL scatter, which stays interactive with thousands of markers
+    scatter = dict(
+        type='scattergl',
+        x=times,
+        y=downcast_array_for_display(sizes, 0),
         mode='markers',
         marker=dict(
-            size=df['position_size'].apply(lambda x: min(max(x/1e6, 8), 25)),  # Scale marker size
-            color=df['color'],
-            line=dict(width=2, color=DISCORD_COLORS['light']),
+            size=np.clip(sizes / 1e6, 8, 25),  # Scale marker size
+            color=colors,
+            line=_WHALE_MARKER_LINE,
             opacity=0.8
         ),
-        text=df.apply(lambda row: f"{row['symbol']}<br>{row['activity']}<br>${row['position_size']:,.0f}", axis=1),
+        text=hover_text,
         hovertemplate='<b>%{text}</b><br>Time: %{x}<extra></extra>',
         name='Whale Activity'
-    ))
+    )
     
-    fig.update_layout(
-        title=dict(
-            text="🐋 Whale Activity Timeline",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Time",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Position Size ($)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5,
-            type='log'  # Log scale for better visualization
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
+    return _figure([scatter], dict(
+        title=_title("🐋 Whale Activity Timeline"),
+        xaxis=_axis("Time"),
+        yaxis=_axis("Position Size ($)", type='log'),  # Log scale for better visualization
+        **_THEME_LAYOUT,
         hovermode='closest',
         showlegend=False,
         margin=dict(t=50, b=50, l=50, r=50)
-    )
-    
-    return fig
+    ))
 
+# Line series longer than this render with WebGL. Short ones stay SVG, since
+# browsers only allow a handful of WebGL contexts per page
+SVG_MAX_POINTS = 1000
+
+@_memoize_chart
 def create_funding_history_chart(df: pd.DataFrame, coin: str) -> go.Figure:
     """Create funding rate history chart"""
     
     if df.empty:
         return create_empty_chart(f"No funding history available for {coin}")
     
-    fig = go.Figure()
-    
-    # Add line chart
-    fig.add_trace(go.Scatter(
+    # Line chart
+    line = dict(
+        type='scattergl' if len(df) > SVG_MAX_POINTS else 'scatter',
         x=df['datetime'],
-        y=df['fundingRate'],
+        y=downcast_array_for_display(df['fundingRate'], 4),
         mode='lines+markers',
-        line=dict(color=DISCORD_COLORS['primary'], width=2),
-        marker=dict(size=4, color=DISCORD_COLORS['primary']),
+        line=_HISTORY_LINE,
+        marker=_HISTORY_MARKER,
         fill='tonexty' if df['fundingRate'].min() < 0 else 'tozeroy',
-        fillcolor=f"rgba{(*hex_to_rgb(DISCORD_COLORS['primary']), 0.1)}",
+        fillcolor=DISCORD_RGBA_10['primary'],
         hovertemplate='<b>%{x}</b><br>Funding Rate: %{y:.4f}%<extra></extra>',
         name=f'{coin} Funding Rate'
-    ))
-    
-    # Add zero line
-    fig.add_hline(y=0, line_dash="dash", line_color=DISCORD_COLORS['muted'], opacity=0.5)
-    
-    fig.update_layout(
-        title=dict(
-            text=f"📈 {coin} Funding Rate History",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Time",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Funding Rate (%)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
-        hovermode='x unified',
-        showlegend=False,
-        margin=dict(t=50, b=50, l=50, r=50)
     )
     
-    return fig
+    return _figure([line], dict(
+        title=_title(f"📈 {coin} Funding Rate History"),
+        xaxis=_axis("Time"),
+        yaxis=_axis("Funding Rate (%)"),
+        **_BASE_LAYOUT,
+        shapes=[_ZERO_LINE]
+    ))
 
+@_memoize_chart
 def create_basis_comparison_chart(basis_data: Dict[str, float], coins: List[str]) -> go.Figure:
     """Create basis comparison chart"""
     
-    filtered_basis = {coin: basis_data.get(coin, 0) for coin in coins if coin in basis_data}
+    # Selected coins with a basis, each once and in selection order
+    coins_list = [coin for coin in dict.fromkeys(coins) if coin in basis_data]
     
-    if not filtered_basis:
+    if not coins_list:
         return create_empty_chart("No basis data available")
     
-    coins_list = list(filtered_basis.keys())
-    basis_values = list(filtered_basis.values())
+    basis_values = np.fromiter((basis_data[coin] for coin in coins_list), dtype=np.float64, count=len(coins_list))
     
     # Color based on basis value
-    colors = [
-        DISCORD_COLORS['success'] if basis > 0.1 else 
-        DISCORD_COLORS['danger'] if basis < -0.1 else 
-        DISCORD_COLORS['warning'] 
-        for basis in basis_values
-    ]
-    
-    fig = go.Figure()
+    colors = np.select(
+        [basis_values > 0.1, basis_values < -0.1],
+        [DISCORD_COLORS['success'], DISCORD_COLORS['danger']],
+        DISCORD_COLORS['warning']
+    )
     
-    fig.add_trace(go.Bar(
+    bar = dict(
+        type='bar',
         x=coins_list,
-        y=basis_values,
-        marker_color=colors,
-        text=[f"{basis:.3f}%" for basis in basis_values],
+        y=downcast_array_for_display(basis_values, 3),
+        marker=dict(color=colors),
+        text=np.char.mod('%.3f%%', basis_values),
         textposition='outside',
         textfont=dict(color=DISCORD_COLORS['light'], size=12),
         hovertemplate='<b>%{x}</b><br>Basis: %{y:.3f}%<extra></extra>',
         name='Basis'
-    ))
-    
-    # Add zero line
-    fig.add_hline(y=0, line_dash="dash", line_color=DISCORD_COLORS['muted'], opacity=0.5)
+    )
     
-    fig.update_layout(
-        title=dict(
-            text="📊 Futures vs Spot Basis",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Assets",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Basis (%)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
-        hovermode='x unified',
+    return _figure([bar], dict(
+        title=_title("📊 Futures vs Spot Basis"),
+        xaxis=_axis("Assets"),
+        yaxis=_axis("Basis (%)"),
+        **_BASE_LAYOUT,
+        shapes=[_ZERO_LINE]
+    ))
+
+def _fmt_money(values: np.ndarray) -> np.ndarray:
+    """Bar labels: $1.2M above a million, $123,456 otherwise"""
+    big = values > 1e6
+    text = np.char.mod('$%.1fM', values / 1e6).astype(object)
+    # %-formatting has no thousands separator, so only the small values go through format()
+    text[~big] = [f"${val:,.0f}" for val in values[~big].tolist()]
+    return text
+
+def _metric_bar(coins: List[str], values: np.ndarray, name: str, color, text, hovertemplate: str) -> Dict:
+    """Bar trace for one multi-metric panel"""
+    return dict(
+        type='bar',
+        x=coins,
+        y=values,
+        marker=dict(color=color),
+        name=name,
         showlegend=False,
-        margin=dict(t=50, b=50, l=50, r=50)
+        text=text,
+        textposition='outside',
+        hovertemplate=hovertemplate
     )
-    
-    return fig
 
-def create_multi_metric_chart(data: Dict, coins: List[str]) -> go.Figure:
-    """Create a comprehensive multi-metric chart with subplots"""
-    
-    # Create subplots
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=(
-            "💰 Funding Rates", 
-            "📊 Open Interest", 
-            "📈 24h Volume", 
-            "⚖️ Basis"
-        ),
-        specs=[
-            [{"type": "bar"}, {"type": "bar"}],
-            [{"type": "bar"}, {"type": "bar"}]
-        ],
+def _funding_panel(coins: List[str], values: np.ndarray) -> Dict:
+    """Funding rates (top-left)"""
+    return _metric_bar(
+        coins, downcast_array_for_display(values, 4), "Funding Rate",
+        np.where(values >= 0, DISCORD_COLORS['success'], DISCORD_COLORS['danger']),
+        np.char.mod('%.3f%%', values),
+        '<b>%{x}</b><br>Funding: %{y:.4f}%<extra></extra>'
+    )
+
+def _open_interest_panel(coins: List[str], values: np.ndarray) -> Dict:
+    """Open interest (top-right)"""
+    return _metric_bar(
+        coins, downcast_array_for_display(values, 0), "Open Interest", DISCORD_COLORS['info'], _fmt_money(values),
+        '<b>%{x}</b><br>OI: $%{y:,.0f}<extra></extra>'
+    )
+
+def _volume_panel(coins: List[str], values: np.ndarray) -> Dict:
+    """24h volume (bottom-left)"""
+    return _metric_bar(
+        coins, downcast_array_for_display(values, 0), "24h Volume", DISCORD_COLORS['secondary'], _fmt_money(values),
+        '<b>%{x}</b><br>Volume: $%{y:,.0f}<extra></extra>'
+    )
+
+def _basis_panel(coins: List[str], values: np.ndarray) -> Dict:
+    """Basis (bottom-right)"""
+    colors = np.select(
+        [values > 0.1, values < -0.1],
+        [DISCORD_COLORS['success'], DISCORD_COLORS['danger']],
+        DISCORD_COLORS['warning']
+    )
+    return _metric_bar(
+        coins, downcast_array_for_display(values, 3), "Basis", colors, np.char.mod('%.3f%%', values),
+        '<b>%{x}</b><br>Basis: %{y:.3f}%<extra></extra>'
+    )
+
+# Title and trace builder of each multi-metric panel, in grid order
+MULTI_METRIC_PANELS = {
+    'funding': ("💰 Funding Rates", _funding_panel),
+    'open_interest': ("📊 Open Interest", _open_interest_panel),
+    'volume': ("📈 24h Volume", _volume_panel),
+    'basis': ("⚖️ Basis", _basis_panel),
+}
+
+@lru_cache(maxsize=16)
+def _multi_metric_grid(panels: tuple) -> Dict:
+    """Subplot grid layout for the given panels, two per row"""
+    # A grid only depends on which panels are shown, so make_subplots (and its
+    # validation) runs once per combination; charts copy its axis domains
+    # and subplot titles
+    rows = (len(panels) + 1) // 2
+    cols = min(len(panels), 2)
+    # With an odd count the last row's second cell has no panel, so it gets
+    # no axes at all rather than an empty gridded plot
+    cells = [{"type": "bar"}] * len(panels) + [None] * (rows * cols - len(panels))
+    return make_subplots(
+        rows=rows, cols=cols,
+        subplot_titles=[MULTI_METRIC_PANELS[panel][0] for panel in panels],
+        specs=[cells[row * cols:(row + 1) * cols] for row in range(rows)],
         vertical_spacing=0.12,
         horizontal_spacing=0.1
-    )
+    ).layout.to_plotly_json()
+
+@_memoize_chart
+def create_multi_metric_chart(data: Dict, coins: List[str],
+                              panels: Sequence[str] = tuple(MULTI_METRIC_PANELS)) -> go.Figure:
+    """Create a comprehensive multi-metric chart with subplots for the requested panels"""
+    
+    panels = tuple(panels)
+    unknown = set(panels) - MULTI_METRIC_PANELS.keys()
+    if unknown:
+        raise ValueError(f"Unknown multi-metric panels: {sorted(unknown)}")
+    if not panels:
+        return create_empty_chart("No panels selected")
     
     # Extract data
-    funding_rates = data.get('funding_rates', {})
-    open_interest = data.get('open_interest', {})
-    volume_data = data.get('perpetual_data', {}).get('volume_24h', {})
-    basis_data = data.get('basis_data', {})
-    
-    # Filter coins that have data
-    active_coins = [coin for coin in coins if any([
-        coin in funding_rates,
-        coin in open_interest,
-        coin in volume_data,
-        coin in basis_data
-    ])]
-    
-    if not active_coins:
-        return create_empty_chart("No data available for selected coins")
+    sources = {
+        'funding': data.get('funding_rates', {}),
+        'open_interest': data.get('open_interest', {}),
+        'volume': data.get('perpetual_data', {}).get('volume_24h', {}),
+        'basis': data.get('basis_data', {}),
+    }
+    values = [sources[panel] for panel in panels]
     
-    # Funding Rates (top-left)
-    if funding_rates:
-        funding_values = [funding_rates.get(coin, 0) for coin in active_coins]
-        funding_colors = [DISCORD_COLORS['success'] if rate >= 0 else DISCORD_COLORS['danger'] for rate in funding_values]
-        
-        fig.add_trace(
-            go.Bar(
-                x=active_coins,
-                y=funding_values,
-                marker_color=funding_colors,
-                name="Funding Rate",
-                showlegend=False,
-                text=[f"{rate:.3f}%" for rate in funding_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Funding: %{y:.4f}%<extra></extra>'
-            ),
-            row=1, col=1
-        )
+    # One Series per metric, so coins are matched with index lookups
+    # instead of a dict.get per coin per metric
+    series = [pd.Series(metric, dtype=np.float64) for metric in values]
     
-    # Open Interest (top-right)
-    if open_interest:
-        oi_values = [open_interest.get(coin, 0) for coin in active_coins]
-        
-        fig.add_trace(
-            go.Bar(
-                x=active_coins,
-                y=oi_values,
-                marker_color=DISCORD_COLORS['info'],
-                name="Open Interest",
-                showlegend=False,
-                text=[f"${val/1e6:.1f}M" if val > 1e6 else f"${val:,.0f}" for val in oi_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>OI: $%{y:,.0f}<extra></extra>'
-            ),
-            row=1, col=2
-        )
+    # Coins that have data for any shown metric, in selection order
+    selected = pd.Index(coins)
+    covered = series[0].index
+    for metric in series[1:]:
+        covered = covered.union(metric.index)
+    active = selected[selected.isin(covered)]
     
-    # Volume 24h (bottom-left)
-    if volume_data:
-        volume_values = [volume_data.get(coin, 0) for coin in active_coins]
-        
-        fig.add_trace(
-            go.Bar(
-                x=active_coins,
-                y=volume_values,
-                marker_color=DISCORD_COLORS['secondary'],
-                name="24h Volume",
-                showlegend=False,
-                text=[f"${val/1e6:.1f}M" if val > 1e6 else f"${val:,.0f}" for val in volume_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Volume: $%{y:,.0f}<extra></extra>'
-            ),
-            row=2, col=1
-        )
+    if active.empty:
+        return create_empty_chart("No data available for selected coins")
     
-    # Basis (bottom-right)
-    if basis_data:
-        basis_values = [basis_data.get(coin, 0) for coin in active_coins]
-        basis_colors = [
-            DISCORD_COLORS['success'] if basis > 0.1 else 
-            DISCORD_COLORS['danger'] if basis < -0.1 else 
-            DISCORD_COLORS['warning'] 
-            for basis in basis_values
-        ]
-        
-        fig.add_trace(
-            go.Bar(
-                x=active_coins,
-                y=basis_values,
-                marker_color=basis_colors,
-                name="Basis",
-                showlegend=False,
-                text=[f"{basis:.3f}%" for basis in basis_values],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Basis: %{y:.3f}%<extra></extra>'
-            ),
-            row=2, col=2
-        )
+    active_coins = active.tolist()
     
-    # Update layout
-    fig.update_layout(
-        title=dict(
-            text="📊 Multi-Metric Dashboard",
-            font=dict(size=20, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
-        height=700,
-        margin=dict(t=80, b=50, l=50, r=50)
-    )
+    # Each panel's trace is built from freshly reindexed values, then pinned
+    # to its cell of the grid ('' is x/y, '2' is x2/y2, ...)
+    cells = [
+        (panel, metric, str(cell + 1) if cell else '')
+        for cell, (panel, source, metric) in enumerate(zip(panels, values, series))
+        if source
+    ]
+    traces = [
+        dict(MULTI_METRIC_PANELS[panel][1](active_coins, metric.reindex(active, fill_value=0).to_numpy()),
+             xaxis=f'x{axis}', yaxis=f'y{axis}')
+        for panel, metric, axis in cells
+    ]
     
-    # Update all axes
-    for i in range(1, 3):
-        for j in range(1, 3):
-            fig.update_xaxes(
-                tickfont=dict(color=DISCORD_COLORS['light'], size=10),
-                gridcolor=DISCORD_COLORS['muted'],
-                gridwidth=0.5,
-                row=i, col=j
-            )
-            fig.update_yaxes(
-                tickfont=dict(color=DISCORD_COLORS['light'], size=10),
-                gridcolor=DISCORD_COLORS['muted'],
-                gridwidth=0.5,
-                row=i, col=j
-            )
-    
-    return fig
+    # Every subplot axis with a trace gets the same style on top of its grid
+    # placement
+    grid = _multi_metric_grid(panels)
+    subplot_axis = {**_AXIS_STYLE, 'tickfont': dict(color=DISCORD_COLORS['light'], size=10)}
+    layout = {
+        **grid,
+        **{
+            f'{direction}axis{axis}': {**grid[f'{direction}axis{axis}'], **subplot_axis}
+            for direction in 'xy'
+            for _, _, axis in cells
+        },
+        'title': _title("📊 Multi-Metric Dashboard", size=20),
+        **_THEME_LAYOUT,
+        'height': 350 * ((len(panels) + 1) // 2),
+        'margin': dict(t=80, b=50, l=50, r=50)
+    }
+    
+    return _figure(traces, layout)
+
+# Anomaly bar color per severity; anything else is muted
+_SEVERITY_COLORS = {
+    'HIGH': DISCORD_COLORS['danger'],
+    'MEDIUM': DISCORD_COLORS['warning'],
+    'LOW': DISCORD_COLORS['info']
+}
 
+@_memoize_chart
 def create_anomaly_detection_chart(anomalies: List[Dict]) -> go.Figure:
     """Create chart for funding rate anomalies"""
     
@@ -545,89 +627,59 @@ def create_anomaly_detection_chart(anomalies: List[Dict]) -> go.Figure:
     # Sort by absolute funding rate
     df = df.sort_values('funding_rate', key=abs, ascending=False)
     
-    # Color mapping
-    color_map = {
-        'HIGH': DISCORD_COLORS['danger'],
-        'MEDIUM': DISCORD_COLORS['warning'],
-        'LOW': DISCORD_COLORS['info']
-    }
-    
-    colors = [color_map.get(severity, DISCORD_COLORS['muted']) for severity in df['severity']]
+    colors = [_SEVERITY_COLORS.get(severity, DISCORD_COLORS['muted']) for severity in df['severity']]
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=df['coin'],
-        y=df['funding_rate'],
-        marker_color=colors,
-        text=[f"{rate:.4f}%<br>{severity}" for rate, severity in zip(df['funding_rate'], df['severity'])],
+    bar = dict(
+        type='bar',
+        x=df['coin'].tolist(),
+        y=downcast_array_for_display(df['funding_rate'], 4),
+        marker=dict(color=colors),
+        text=np.char.add(
+            np.char.mod('%.4f%%<br>', df['funding_rate'].to_numpy(dtype=np.float64)),
+            df['severity'].to_numpy(dtype=str)
+        ),
         textposition='outside',
         textfont=dict(color=DISCORD_COLORS['light'], size=11),
         hovertemplate='<b>%{x}</b><br>%{customdata}<br>Rate: %{y:.4f}%<extra></extra>',
-        customdata=df['description'],
+        customdata=df['description'].tolist(),
         name='Anomalies'
-    ))
-    
-    fig.add_hline(y=0, line_dash="dash", line_color=DISCORD_COLORS['muted'], opacity=0.5)
-    
-    fig.update_layout(
-        title=dict(
-            text="🚨 Funding Rate Anomalies",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Assets",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Funding Rate (%)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
-        hovermode='x unified',
-        showlegend=False,
-        margin=dict(t=50, b=50, l=50, r=50)
     )
     
-    return fig
+    return _figure([bar], dict(
+        title=_title("🚨 Funding Rate Anomalies"),
+        xaxis=_axis("Assets"),
+        yaxis=_axis("Funding Rate (%)"),
+        **_BASE_LAYOUT,
+        shapes=[_ZERO_LINE]
+    ))
 
+# Named colorscales mean different palettes in plotly.py and plotly.js, so
+# the one the validator resolves 'RdBu' to is expanded once here
+_CORRELATION_COLORSCALE = go.Heatmap(colorscale='RdBu').colorscale
+
+@_memoize_chart
 def create_correlation_heatmap(correlation_data: pd.DataFrame) -> go.Figure:
     """Create correlation heatmap for funding rates"""
     
     if correlation_data.empty:
         return create_empty_chart("No correlation data available")
     
-    fig = go.Figure(data=go.Heatmap(
-        z=correlation_data.values,
+    heatmap = dict(
+        type='heatmap',
+        z=downcast_array_for_display(correlation_data.values, 3),
         x=correlation_data.columns,
         y=correlation_data.index,
-        colorscale='RdBu',
+        colorscale=_CORRELATION_COLORSCALE,
         zmid=0,
-        text=correlation_data.round(3).values,
-        texttemplate="%{text}",
+        # Cell labels are formatted from z in the browser (~ trims trailing
+        # zeros, as round(3) did), so no second matrix of text is shipped
+        texttemplate="%{z:.3~f}",
         textfont={"size": 10, "color": "white"},
         hovertemplate='<b>%{y} vs %{x}</b><br>Correlation: %{z:.3f}<extra></extra>'
-    ))
+    )
     
-    fig.update_layout(
-        title=dict(
-            text="🔄 Funding Rate Correlations",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
+    return _figure([heatmap], dict(
+        title=_title("🔄 Funding Rate Correlations"),
         xaxis=dict(
             tickfont=dict(color=DISCORD_COLORS['light']),
             side='bottom'
@@ -635,21 +687,19 @@ def create_correlation_heatmap(correlation_data: pd.DataFrame) -> go.Figure:
         yaxis=dict(
             tickfont=dict(color=DISCORD_COLORS['light'])
         ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
+        **_THEME_LAYOUT,
         margin=dict(t=50, b=50, l=80, r=50)
-    )
-    
-    return fig
+    ))
 
+@_memoize_chart
 def create_market_sentiment_gauge(sentiment_score: float) -> go.Figure:
     """Create a gauge chart for market sentiment based on funding rates"""
     
     # Normalize sentiment score to 0-100 scale
     normalized_score = max(0, min(100, (sentiment_score + 1) * 50))
     
-    fig = go.Figure(go.Indicator(
+    gauge = dict(
+        type='indicator',
         mode="gauge+number+delta",
         value=normalized_score,
         domain={'x': [0, 1], 'y': [0, 1]},
@@ -670,73 +720,103 @@ def create_market_sentiment_gauge(sentiment_score: float) -> go.Figure:
                 'value': normalized_score
             }
         }
-    ))
+    )
     
-    fig.update_layout(
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
+    return _figure([gauge], dict(
+        **_THEME_LAYOUT,
         height=400,
         margin=dict(t=50, b=50, l=50, r=50)
-    )
+    ))
+
+MAX_LINE_POINTS = 2000  # Per trace, before downsampling kicks in
+
+def _lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that best keep the line's shape"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=np.float64)
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    
+    selected = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # The next bucket's average is the third triangle vertex; the last
+        # bucket looks ahead to the final point
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        
+        area = np.abs(
+            (x[selected] - avg_x) * (y[lo:hi] - y[selected])
+            - (x[selected] - x[lo:hi]) * (avg_y - y[selected])
+        )
+        selected = lo + int(np.argmax(area))
+        keep[i + 1] = selected
     
-    return fig
+    return keep
 
+@_memoize_chart
 def create_volume_analysis_chart(volume_data: Dict[str, List], timeframe: str = '24h') -> go.Figure:
     """Create volume analysis chart with trend indicators"""
     
     if not volume_data:
         return create_empty_chart("No volume data available")
     
-    fig = go.Figure()
+    traces = []
     
-    coins = list(volume_data.keys())
+    coins = list(volume_data.keys())[:10]  # Limit to top 10 for readability
+    coins = [coin for coin in coins if volume_data[coin]]
     
-    for i, coin in enumerate(coins[:10]):  # Limit to top 10 for readability
+    if not coins:
+        return create_empty_chart("No volume data available")
+    
+    # One shared sample index; each trace takes a view of its own length
+    x_shared = np.arange(max(len(volume_data[coin]) for coin in coins))
+    
+    for coin in coins:
         volumes = volume_data[coin]
-        if not volumes:
-            continue
-            
-        x_values = list(range(len(volumes)))
+        x_values = x_shared[:len(volumes)]
+        
+        # Long series are thinned to the points that keep their visual shape,
+        # so the figure JSON stays bounded
+        if len(volumes) > MAX_LINE_POINTS:
+            y_values = np.asarray(volumes, dtype=np.float64)
+            keep = _lttb_indices(y_values, MAX_LINE_POINTS)
+            x_values, volumes = keep, y_values[keep]
         
-        fig.add_trace(go.Scatter(
+        # WebGL lines keep long series responsive in the browser
+        traces.append(dict(
+            type='scattergl',
             x=x_values,
-            y=volumes,
+            y=downcast_array_for_display(volumes, 0),
             mode='lines',
             name=coin,
-            line=dict(width=2),
+            line=_VOLUME_LINE,
             hovertemplate=f'<b>{coin}</b><br>Volume: $%{{y:,.0f}}<extra></extra>'
         ))
     
-    fig.update_layout(
-        title=dict(
-            text=f"📈 Volume Analysis ({timeframe})",
-            font=dict(size=18, color=DISCORD_COLORS['light'], family="Whitney"),
-            x=0.5
-        ),
-        xaxis=dict(
-            title=dict(
-                text="Time",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        yaxis=dict(
-            title=dict(
-                text="Volume ($)",
-                font=dict(color=DISCORD_COLORS['light'])
-            ),
-            tickfont=dict(color=DISCORD_COLORS['light']),
-            gridcolor=DISCORD_COLORS['muted'],
-            gridwidth=0.5
-        ),
-        plot_bgcolor=DISCORD_COLORS['dark'],
-        paper_bgcolor=DISCORD_COLORS['darker'],
-        font=dict(family="Whitney", color=DISCORD_COLORS['light']),
+    return _figure(traces, dict(
+        title=_title(f"📈 Volume Analysis ({timeframe})"),
+        xaxis=_axis("Time"),
+        yaxis=_axis("Volume ($)"),
+        **_THEME_LAYOUT,
         hovermode='x unified',
         margin=dict(t=50, b=50, l=50, r=50)
-    )
-    
-    return fig
\ No newline at end of file
+    ))
+
+# JSON-returning variants, for frontends that take the serialized figure as is
+create_funding_chart_json = _json_variant(create_funding_chart)
+create_open_interest_chart_json = _json_variant(create_open_interest_chart)
+create_whale_activity_chart_json = _json_variant(create_whale_activity_chart)
+create_funding_history_chart_json = _json_variant(create_funding_history_chart)
+create_basis_comparison_chart_json = _json_variant(create_basis_comparison_chart)
+create_multi_metric_chart_json = _json_variant(create_multi_metric_chart)
+create_anomaly_detection_chart_json = _json_variant(create_anomaly_detection_chart)
+create_correlation_heatmap_json = _json_variant(create_correlation_heatmap)
+create_market_sentiment_gauge_json = _json_variant(create_market_sentiment_gauge)
+create_volume_analysis_chart_json = _json_variant(create_volume_analysis_chart)
@@ -0,0 +1,43 @@
+# utils/formatting.py
+import numpy as np
+
+def format_money_compact(values) -> list:
+    """Vectorized $1.23B / $4.56M / $7.89K formatting"""
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    buckets = [magnitude >= 1e9, magnitude >= 1e6, magnitude >= 1e3]
+    scaled = values / np.select(buckets, [1e9, 1e6, 1e3], 1.0)
+    suffix = np.select(buckets, ['B', 'M', 'K'], '')
+    return [f"${value:.2f}{unit}" for value, unit in zip(scaled.tolist(), suffix.tolist())]
+
+FLOAT32_EXACT = 2 ** 24  # Largest integer float32 represents exactly
+
+def _fits_float32(values, places) -> bool:
+    """Whether values read back from float32 still format to the same places decimals"""
+    values = np.asarray(values, dtype=np.float64)
+    # Beyond float32's exact integers digits are lost outright; cheap to rule out first
+    if np.nanmax(np.abs(values), initial=0.0) * 10.0 ** places >= FLOAT32_EXACT:
+        return False
+    # Small magnitudes can still flip a rounding tie (float32(0.00125) is
+    # 0.0012499...), so compare the rendered digits themselves
+    fmt = f'%.{places}f'
+    widened = values.astype(np.float32).astype(np.float64)
+    return bool(np.array_equal(np.char.mod(fmt, values), np.char.mod(fmt, widened)))
+
+def downcast_for_display(df, decimals=4):
+    """Downcast float columns to float32 where that leaves the displayed digits unchanged"""
+    # decimals is either one count for every column or a per-column mapping;
+    # columns missing from the mapping are left alone
+    if not isinstance(decimals, dict):
+        decimals = dict.fromkeys(df.columns, decimals)
+    downcast = {
+        col: 'float32' for col, places in decimals.items()
+        if col in df.columns and df[col].dtype == np.float64
+        and _fits_float32(df[col].to_numpy(), places)
+    }
+    return df.astype(downcast, copy=False) if downcast else df
+
+def downcast_array_for_display(values, decimals=4) -> np.ndarray:
+    """Float array, as float32 where that leaves the digits at decimals places unchanged"""
+    values = np.asarray(values, dtype=np.float64)
+    return values.astype(np.float32) if _fits_float32(values, decimals) else values
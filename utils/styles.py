@@ -0,0 +1,307 @@
+# Discord-inspired theme for the dashboard
+
+DISCORD_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Whitney:wght@400;500;600;700&display=swap');
+    
+    /* Main app styling */
+    .stApp {
+        background: linear-gradient(135deg, #36393f 0%, #2f3136 25%, #36393f 50%, #202225 75%, #2f3136 100%);
+        font-family: 'Whitney', 'Helvetica Neue', Helvetica, Arial, sans-serif;
+    }
+    
+    /* Hide default streamlit elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* Custom header */
+    .discord-header {
+        background: linear-gradient(135deg, #5865f2 0%, #7289da 35%, #5865f2 100%);
+        padding: 1.5rem 2rem;
+        border-radius: 16px;
+        margin-bottom: 2rem;
+        box-shadow: 0 8px 32px rgba(88, 101, 242, 0.3);
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .discord-header::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="discord-pattern" x="0" y="0" width="20" height="20" patternUnits="userSpaceOnUse"><circle cx="10" cy="10" r="1" fill="rgba(255,255,255,0.1)"/></pattern></defs><rect width="100" height="100" fill="url(%23discord-pattern)"/></svg>');
+        opacity: 0.3;
+    }
+    
+    .discord-header h1 {
+        color: white;
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin: 0;
+        text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        position: relative;
+        z-index: 1;
+    }
+    
+    .discord-header p {
+        color: rgba(255,255,255,0.9);
+        font-size: 1.1rem;
+        margin: 0.5rem 0 0 0;
+        position: relative;
+        z-index: 1;
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg {
+        background: #2f3136;
+        border-right: 1px solid #40444b;
+    }
+    
+    .css-1d391kg .css-1y4p8pa {
+        background: #36393f;
+        border-radius: 8px;
+        border: 1px solid #40444b;
+        color: #dcddde;
+    }
+    
+    /* Card styling */
+    .discord-card {
+        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
+        border: 1px solid #40444b;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 4px 16px rgba(0,0,0,0.3);
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .discord-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 4px;
+        height: 100%;
+        background: linear-gradient(180deg, #5865f2, #7289da);
+        border-radius: 0 0 0 4px;
+    }
+    
+    .discord-card h3 {
+        color: #ffffff;
+        font-weight: 600;
+        margin-bottom: 1rem;
+        font-size: 1.3rem;
+    }
+    
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        background: #2f3136;
+        border-radius: 8px;
+        padding: 4px;
+        border: 1px solid #40444b;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: transparent;
+        color: #b9bbbe;
+        border-radius: 6px;
+        font-weight: 500;
+        padding: 12px 20px;
+        transition: all 0.2s ease;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        background: #40444b;
+        color: #dcddde;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #5865f2, #7289da) !important;
+        color: white !important;
+        box-shadow: 0 2px 8px rgba(88, 101, 242, 0.4);
+    }
+    
+    /* Metric cards */
+    .metric-card {
+        background: linear-gradient(145deg, #40444b 0%, #36393f 100%);
+        border: 1px solid #4f545c;
+        border-radius: 10px;
+        padding: 1.2rem;
+        text-align: center;
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 24px rgba(88, 101, 242, 0.2);
+    }
+    
+    .metric-value {
+        font-size: 1.8rem;
+        font-weight: 700;
+        color: #00d4aa;
+        margin-bottom: 0.5rem;
+    }
+    
+    .metric-label {
+        color: #b9bbbe;
+        font-size: 0.9rem;
+        font-weight: 500;
+    }
+    
+    /* News card styling */
+    .news-card {
+        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
+        border: 1px solid #40444b;
+        border-radius: 10px;
+        padding: 1.2rem;
+        margin-bottom: 1rem;
+        transition: all 0.3s ease;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .news-card::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 3px;
+        height: 100%;
+        background: linear-gradient(180deg, #faa61a, #f04747);
+    }
+    
+    .news-card:hover {
+        transform: translateX(4px);
+        box-shadow: 0 6px 20px rgba(250, 166, 26, 0.2);
+        border-color: #faa61a;
+    }
+    
+    .news-title {
+        color: #ffffff;
+        font-weight: 600;
+        font-size: 1.1rem;
+        margin-bottom: 0.5rem;
+        line-height: 1.4;
+    }
+    
+    .news-meta {
+        color: #72767d;
+        font-size: 0.85rem;
+    }
+    
+    .news-link {
+        color: #00d4aa;
+        text-decoration: none;
+        font-weight: 500;
+    }
+    
+    .news-link:hover {
+        color: #1abc9c;
+        text-decoration: underline;
+    }
+    
+    /* Whale activity styling */
+    .whale-activity {
+        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
+        border: 1px solid #40444b;
+        border-radius: 8px;
+        padding: 1rem;
+        margin-bottom: 0.8rem;
+        border-left: 4px solid #f04747;
+    }
+    
+    .whale-activity.buy {
+        border-left-color: #43b581;
+    }
+    
+    .whale-activity.sell {
+        border-left-color: #f04747;
+    }
+    
+    /* Error/Warning styling */
+    .whale-error {
+        background: linear-gradient(145deg, #36393f 0%, #2f3136 100%);
+        border: 1px solid #f04747;
+        border-radius: 8px;
+        padding: 1rem;
+        margin-bottom: 0.8rem;
+        color: #f04747;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background: linear-gradient(135deg, #5865f2, #7289da);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.6rem 1.5rem;
+        font-weight: 600;
+        transition: all 0.2s ease;
+        box-shadow: 0 2px 8px rgba(88, 101, 242, 0.3);
+    }
+    
+    .stButton > button:hover {
+        background: linear-gradient(135deg, #4752c4, #5865f2);
+        transform: translateY(-1px);
+        box-shadow: 0 4px 12px rgba(88, 101, 242, 0.4);
+    }
+    
+    /* DataFrame styling */
+    .dataframe {
+        background: #2f3136;
+        border: 1px solid #40444b;
+        border-radius: 8px;
+    }
+    
+    /* Text colors */
+    .stMarkdown, .stText {
+        color: #dcddde;
+    }
+    
+    h1, h2, h3, h4, h5, h6 {
+        color: #ffffff !important;
+    }
+    
+    /* Success/Error indicators */
+    .positive {
+        color: #43b581 !important;
+    }
+    
+    .negative {
+        color: #f04747 !important;
+    }
+    
+    .neutral {
+        color: #faa61a !important;
+    }
+    
+    /* Loading spinner */
+    .stSpinner {
+        color: #5865f2;
+    }
+    
+    /* Custom scrollbar */
+    ::-webkit-scrollbar {
+        width: 8px;
+    }
+    
+    ::-webkit-scrollbar-track {
+        background: #2f3136;
+    }
+    
+    ::-webkit-scrollbar-thumb {
+        background: #5865f2;
+        border-radius: 4px;
+    }
+    
+    ::-webkit-scrollbar-thumb:hover {
+        background: #4752c4;
+    }
+</style>
+"""